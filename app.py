@@ -6,15 +6,20 @@ based on scale, budget, power, and workload requirements.
 """
 
 import streamlit as st
-import pandas as pd
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Core modules
 from core.models import (
     UserInputs,
     WorkloadType,
     TopologyType,
-    TopologyRecommendation
+    TopologyRecommendation,
+    TopologyCharacteristics,
+    TopologyScore
 )
 from core.decision_engine import (
     classify_inputs,
@@ -22,16 +27,60 @@ from core.decision_engine import (
     generate_explanation,
     explain_rule_application
 )
-from core.scoring import rank_topologies
-from core.topology import get_topology_characteristics, get_topology_comparison
+from core.config import SCALE_THRESHOLDS, BUDGET_THRESHOLDS, POWER_THRESHOLDS
+from core.scoring import rank_topologies, SCORING_WEIGHTS
+from core.topology import get_topology_characteristics
 from utils.validators import validate_all_inputs
-from visualization.graphs import draw_topology_graph
-from visualization.charts import (
-    create_comparison_dataframe,
-    create_score_comparison_chart,
-    create_score_breakdown_chart
+from utils.templates import (
+    CLASS_CARD_TMPL,
+    CONDITION_TMPL,
+    WHYNOT_TMPL,
+    SECTION_CARD_TMPL,
+    RECOMMENDED_CARD_TMPL,
+    RULE_APPLIED_TMPL,
+    SUMMARY_TMPL,
+    HEADER_HTML,
+    INPUT_SECTION_HTML,
+    RECOMMENDATION_SECTION_HTML,
+    EXPLAIN_SECTION_HTML,
+    INFO_CARDS_HTML,
+    INPUT_INTRO_HTML,
+    SCALE_LABEL_HTML,
+    CONSTRAINTS_LABEL_HTML,
+    WORKLOAD_LABEL_HTML,
+    RULE_PROCESS_HTML,
+    CONDITIONS_LABEL_HTML,
+    WHY_NOT_HEADER_HTML,
+    SUMMARY_HEADER_HTML,
+    FOOTER_HTML,
+    GET_STARTED_HTML
+)
+
+# Workload selectbox options and value -> enum lookup. app.py is re-executed
+# on every rerun, so these are rebuilt per run; both are tiny (one entry per
+# WorkloadType member).
+_WORKLOAD_OPTIONS: Final[tuple[str, ...]] = tuple(wt.value for wt in WorkloadType)
+_WORKLOAD_LOOKUP: Final[dict[str, WorkloadType]] = {wt.value: wt for wt in WorkloadType}
+
+# Score breakdown keys -> column names in the scoring transparency table
+_BREAKDOWN_COLUMNS: Final[dict[str, str]] = {
+    "Scale Match": "Scale Score",
+    "Budget Match": "Budget Score",
+    "Power Match": "Power Score",
+    "Workload Suitability": "Workload Score",
+    "Scalability Match": "Scalability Score"
+}
+
+# Tunable decision parameters; part of the persisted recommendation cache key
+_DECISION_CONFIG: Final[tuple] = (
+    SCALE_THRESHOLDS,
+    BUDGET_THRESHOLDS,
+    POWER_THRESHOLDS,
+    SCORING_WEIGHTS
 )
 
+# Ranking markers; third place and below share the bronze marker
+_RANK_MARKERS: Final[tuple[str, ...]] = ("🥇", "🥈", "🥉")
 
 # Page configuration
 st.set_page_config(
@@ -41,1256 +90,525 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Optimized CSS for maximum visibility
-st.markdown("""
-<style>
-/* FORCE LIGHT THEME - ESSENTIAL STYLES ONLY */
-
-/* GLOBAL OVERRIDES - FORCE LIGHT THEME */
-* {
-    color: #000000 !important;
-}
-
-html, body {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.stApp {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.main {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.block-container {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-    padding-top: 2rem;
-    padding-bottom: 2rem;
-    max-width: 1400px;
-}
-
-/* HEADERS - ALL LEVELS */
-h1, h2, h3, h4, h5, h6 {
-    color: #1a1a1a !important;
-    font-weight: 600 !important;
-}
-
-h1 {
-    border-bottom: 2px solid #2E86AB !important;
-    padding-bottom: 12px !important;
-    margin-bottom: 15px !important;
-}
-
-h2 {
-    color: #2E86AB !important;
-    border-left: 3px solid #2E86AB !important;
-    padding-left: 10px !important;
-    margin-top: 25px !important;
-    margin-bottom: 15px !important;
-}
-
-h3 {
-    color: #4a4a4a !important;
-    margin-top: 15px !important;
-}
-
-h4 {
-    color: #495057 !important;
-}
-
-/* TEXT ELEMENTS - COMPREHENSIVE */
-p, span, div, label, li, td, th, a, em, strong, b, i, small, code {
-    color: #000000 !important;
-}
-
-.stMarkdown, .stMarkdown * {
-    color: #000000 !important;
-}
-
-.stText, .stText * {
-    color: #000000 !important;
-}
-
-/* LABELS - ALL INPUT TYPES */
-label, .stLabel, [data-testid*="label"] {
-    color: #000000 !important;
-    font-weight: 600 !important;
-    font-size: 14px !important;
-}
-
-.stTextInput label,
-.stNumberInput label,
-.stSelectbox label,
-.stTextArea label,
-.stDateInput label,
-.stTimeInput label,
-.stFileUploader label,
-.stColorPicker label,
-.stSlider label,
-.stCheckbox label,
-.stRadio label,
-.stMultiSelect label {
-    color: #000000 !important;
-    font-weight: 600 !important;
-}
-
-/* INPUT FIELDS - ALL TYPES */
-input, textarea, select {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-    border: 1px solid #ced4da !important;
-    border-radius: 4px !important;
-}
-
-.stTextInput > div > div > input,
-.stNumberInput > div > div > input,
-.stTextArea > div > div > textarea {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-    border: 1px solid #ced4da !important;
-}
-
-.stTextInput > div > div > input:focus,
-.stNumberInput > div > div > input:focus,
-.stTextArea > div > div > textarea:focus {
-    border-color: #2E86AB !important;
-    box-shadow: 0 0 0 2px rgba(46, 134, 171, 0.15) !important;
-    color: #000000 !important;
-}
-
-/* SELECTBOX - ULTRA COMPREHENSIVE FIX */
-.stSelectbox {
-    color: #000000 !important;
-}
-
-.stSelectbox > div {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.stSelectbox > div > div {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
+# Optimized CSS for maximum visibility, kept in static/app.css
+_STYLE_PATH: Final[Path] = Path(__file__).parent / "static" / "app.css"
 
-.stSelectbox [data-baseweb="select"] {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.stSelectbox [data-baseweb="select"] > div {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
 
-.stSelectbox [data-baseweb="select"] > div > div {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.stSelectbox [data-baseweb="select"] span {
-    color: #000000 !important;
-}
-
-.stSelectbox [data-baseweb="select"] div {
-    color: #000000 !important;
-}
-
-/* DROPDOWN MENUS */
-[data-baseweb="popover"] {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-[data-baseweb="popover"] * {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-[data-baseweb="popover"] li,
-[data-baseweb="popover"] [role="option"],
-[data-baseweb="popover"] [role="menuitem"] {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-[data-baseweb="popover"] [role="option"]:hover,
-[data-baseweb="popover"] li:hover {
-    background-color: #e7f3ff !important;
-    color: #000000 !important;
-}
-
-[data-baseweb="menu"] {
-    background-color: #FFFFFF !important;
-}
-
-[data-baseweb="menu"] li {
-    color: #000000 !important;
-}
-
-/* BUTTONS - ALL STATES */
-.stButton > button {
-    background-color: #2E86AB !important;
-    color: #FFFFFF !important;
-    border: none !important;
-    border-radius: 4px !important;
-    padding: 12px 28px !important;
-    font-weight: 500 !important;
-    font-size: 15px !important;
-}
-
-.stButton > button:hover {
-    background-color: #1e5f7a !important;
-    color: #FFFFFF !important;
-}
-
-/* NUMBER INPUT +/- BUTTONS */
-.stNumberInput button {
-    background-color: #333333 !important;
-    color: #FFFFFF !important;
-    border: 1px solid #555555 !important;
-    border-radius: 3px !important;
-}
-
-.stNumberInput button:hover {
-    background-color: #dc3545 !important;
-    color: #FFFFFF !important;
-}
-
-.stNumberInput button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
-
-.stButton > button:focus {
-    background-color: #1e5f7a !important;
-    color: #FFFFFF !important;
-}
-
-.stButton > button[kind="secondary"] {
-    background-color: #6c757d !important;
-    color: #FFFFFF !important;
-}
-
-.stButton > button[kind="secondary"]:hover {
-    background-color: #545b62 !important;
-    color: #FFFFFF !important;
-}
-
-/* EXPANDERS */
-.streamlit-expanderHeader {
-    background-color: #f8f9fa !important;
-    color: #2E86AB !important;
-    border: 1px solid #dee2e6 !important;
-    border-radius: 4px !important;
-    padding: 14px 18px !important;
-}
-
-.streamlit-expanderHeader * {
-    color: #2E86AB !important;
-}
-
-.streamlit-expanderHeader p {
-    color: #2E86AB !important;
-    font-weight: 500 !important;
-}
-
-.streamlit-expanderHeader span {
-    color: #2E86AB !important;
-}
-
-.streamlit-expanderHeader svg {
-    color: #2E86AB !important;
-    fill: #2E86AB !important;
-}
-
-.streamlit-expanderContent {
-    background-color: #FFFFFF !important;
-    border: 1px solid #dee2e6 !important;
-    border-top: none !important;
-    padding: 18px !important;
-}
-
-.streamlit-expanderContent * {
-    color: #000000 !important;
-}
-
-.streamlit-expanderContent p,
-.streamlit-expanderContent li,
-.streamlit-expanderContent div,
-.streamlit-expanderContent span {
-    color: #000000 !important;
-}
-
-/* METRICS */
-[data-testid="stMetricValue"] {
-    color: #2E86AB !important;
-    font-size: 24px !important;
-    font-weight: 700 !important;
-}
-
-[data-testid="stMetricLabel"] {
-    color: #495057 !important;
-    font-size: 14px !important;
-    font-weight: 500 !important;
-}
-
-[data-testid="stMetricDelta"] {
-    color: #495057 !important;
-}
-
-/* HELP/INFO ICONS */
-[data-testid="stTooltipIcon"] {
-    background-color: #e9ecef !important;
-    border: 1px solid #ced4da !important;
-    border-radius: 50% !important;
-    color: #000000 !important;
-    width: 20px !important;
-    height: 20px !important;
-    display: flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-    font-size: 12px !important;
-    font-weight: bold !important;
-}
-
-[data-testid="stTooltipIcon"]:before {
-    content: "i" !important;
-    color: #000000 !important;
-    font-style: italic !important;
-    font-weight: bold !important;
-}
-
-[data-testid="stTooltipIcon"] svg {
-    display: none !important;
-}
-
-/* Alternative tooltip icon selectors */
-.stTooltip [data-testid="stTooltipIcon"],
-.element-container [data-testid="stTooltipIcon"],
-[role="button"][aria-label*="help"] {
-    background-color: #e9ecef !important;
-    border: 1px solid #ced4da !important;
-    border-radius: 50% !important;
-    color: #000000 !important;
-}
-
-/* ALERT BOXES */
-.stAlert, [data-testid="stAlert"] {
-    color: #000000 !important;
-}
-
-.stAlert *, [data-testid="stAlert"] * {
-    color: #000000 !important;
-}
-
-.stInfo {
-    background-color: #e7f3ff !important;
-    border-left: 4px solid #2E86AB !important;
-}
-
-.stInfo * {
-    color: #0c5460 !important;
-}
-
-.stSuccess {
-    background-color: #d4edda !important;
-}
-
-.stSuccess * {
-    color: #155724 !important;
-}
-
-.stWarning {
-    background-color: #fff3cd !important;
-}
-
-.stWarning * {
-    color: #856404 !important;
-}
-
-.stError {
-    background-color: #f8d7da !important;
-}
-
-.stError * {
-    color: #721c24 !important;
-}
-
-/* DATAFRAMES AND TABLES */
-.stDataFrame, [data-testid="stDataFrame"] {
-    background-color: #FFFFFF !important;
-}
-
-.stTable {
-    background-color: #FFFFFF !important;
-}
-
-table {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-table th {
-    background-color: #2E86AB !important;
-    color: #FFFFFF !important;
-    font-weight: 600 !important;
-}
-
-table td {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-table tr {
-    background-color: #FFFFFF !important;
-}
-
-table tr:nth-child(even) {
-    background-color: #f8f9fa !important;
-}
-
-/* CAPTIONS */
-.stCaption, [data-testid="stCaptionContainer"] {
-    color: #6c757d !important;
-}
-
-.stCaption * {
-    color: #6c757d !important;
-}
-
-/* SIDEBAR */
-.css-1d391kg, .css-1cypcdb {
-    background-color: #FFFFFF !important;
-}
-
-.sidebar .sidebar-content {
-    background-color: #FFFFFF !important;
-}
-
-/* TABS */
-.stTabs [data-baseweb="tab-list"] {
-    background-color: #FFFFFF !important;
-}
-
-.stTabs [data-baseweb="tab"] {
-    color: #000000 !important;
-    background-color: #FFFFFF !important;
-}
-
-.stTabs [aria-selected="true"] {
-    color: #2E86AB !important;
-    background-color: #FFFFFF !important;
-}
-
-/* MULTISELECT */
-.stMultiSelect {
-    color: #000000 !important;
-}
-
-.stMultiSelect [data-baseweb="select"] {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.stMultiSelect span {
-    color: #000000 !important;
-}
-
-.stMultiSelect [data-baseweb="tag"] {
-    background-color: #e7f3ff !important;
-    color: #000000 !important;
-}
-
-/* CHECKBOX AND RADIO */
-.stCheckbox {
-    color: #000000 !important;
-}
-
-.stRadio {
-    color: #000000 !important;
-}
-
-.stCheckbox > label {
-    color: #000000 !important;
-}
-
-.stRadio > label {
-    color: #000000 !important;
-}
-
-/* SLIDER */
-.stSlider {
-    color: #000000 !important;
-}
-
-.stSlider > label {
-    color: #000000 !important;
-}
-
-/* FILE UPLOADER */
-.stFileUploader {
-    color: #000000 !important;
-}
-
-.stFileUploader > label {
-    color: #000000 !important;
-}
-
-[data-testid="stFileUploader"] {
-    background-color: #FFFFFF !important;
-}
-
-/* DATE AND TIME INPUTS */
-.stDateInput {
-    color: #000000 !important;
-}
-
-.stTimeInput {
-    color: #000000 !important;
-}
-
-.stDateInput input {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-.stTimeInput input {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-/* COLOR PICKER */
-.stColorPicker {
-    color: #000000 !important;
-}
-
-.stColorPicker > label {
-    color: #000000 !important;
-}
-
-/* SPINNER */
-.stSpinner {
-    color: #2E86AB !important;
-}
-
-.stSpinner > div {
-    color: #2E86AB !important;
-}
-
-/* TOOLTIPS */
-[data-testid="stTooltipIcon"] {
-    color: #6c757d !important;
-}
-
-/* PROGRESS BAR */
-.stProgress > div > div {
-    background-color: #2E86AB !important;
-}
-
-/* JSON */
-.stJson {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-}
-
-/* CODE BLOCKS */
-.stCode {
-    background-color: #f8f9fa !important;
-    color: #000000 !important;
-}
-
-code {
-    background-color: #f8f9fa !important;
-    color: #e83e8c !important;
-    padding: 2px 6px !important;
-    border-radius: 3px !important;
-}
-
-pre {
-    background-color: #f8f9fa !important;
-    color: #000000 !important;
-}
-
-/* LINKS */
-a, a:visited, a:hover {
-    color: #2E86AB !important;
-}
-
-/* STRONG AND EMPHASIS */
-strong, b {
-    color: inherit !important;
-    font-weight: 600 !important;
-}
-
-em, i {
-    color: inherit !important;
-}
-
-/* DIVIDERS */
-hr {
-    border-color: #dee2e6 !important;
-    margin: 30px 0 !important;
-}
-
-/* PLOTLY CHARTS */
-.js-plotly-plot {
-    background-color: #FFFFFF !important;
-}
-
-/* MATPLOTLIB FIGURES */
-.stPlotlyChart {
-    background-color: #FFFFFF !important;
-}
-
-/* HIDE STREAMLIT BRANDING */
-#MainMenu {visibility: hidden !important;}
-footer {visibility: hidden !important;}
-header {visibility: hidden !important;}
-.stDeployButton {visibility: hidden !important;}
-
-/* SCROLLBARS */
-::-webkit-scrollbar {
-    width: 8px !important;
-    height: 8px !important;
-}
-
-::-webkit-scrollbar-track {
-    background: #f1f1f1 !important;
-}
-
-::-webkit-scrollbar-thumb {
-    background: #2E86AB !important;
-    border-radius: 4px !important;
-}
-
-::-webkit-scrollbar-thumb:hover {
-    background: #1e5f7a !important;
-}
-
-/* CONTAINER SPACING */
-.element-container {
-    margin-bottom: 1.5rem !important;
-}
-
-/* CUSTOM CARDS */
-.metric-card {
-    background-color: #FFFFFF !important;
-    color: #000000 !important;
-    padding: 20px !important;
-    border-radius: 8px !important;
-    border: 1px solid #dee2e6 !important;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.05) !important;
-}
+@st.cache_resource(show_spinner=False)
+def load_styles() -> str:
+    """
+    Read the global stylesheet and wrap it in a <style> tag.
+    
+    Streamlit re-executes this script on every rerun, so the file is read
+    through st.cache_resource to hit the disk only once per process.
+    """
+    return f"<style>\n{_STYLE_PATH.read_text(encoding='utf-8')}</style>"
 
-/* FORCE VISIBILITY FOR ANY MISSED ELEMENTS */
-[class*="st"] {
-    color: #000000 !important;
-}
 
-[data-testid*="st"] {
-    color: #000000 !important;
-}
+def inject_styles():
+    """Emit the global stylesheet for the current script run."""
+    st.markdown(load_styles(), unsafe_allow_html=True)
 
-/* DATAFRAME CONTROLS - SHOW/HIDE COLUMNS BUTTON */
-[data-testid="stDataFrameResizeHandle"] {
-    color: #FFFFFF !important;
-    background-color: #2E86AB !important;
-}
 
-[data-testid="stDataFrame"] button {
-    background-color: #2E86AB !important;
-    color: #FFFFFF !important;
-    border: none !important;
-}
+def _fast_valid(racks: int, servers: int, budget_usd: float, power_kw: float) -> bool:
+    """
+    Cheap range check for the common case of in-bounds widget values.
+    
+    The bounds mirror the number_input limits, which all lie inside the
+    ranges accepted by utils.validators. Anything outside them falls
+    through to validate_all_inputs for a proper error message.
+    """
+    return (1 <= racks <= 10000 and 1 <= servers <= 1_000_000 and
+            0.0 <= budget_usd <= 1e9 and 0.1 <= power_kw <= 1e5)
 
-[data-testid="stDataFrame"] button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
 
-[data-testid="stDataFrame"] [role="button"] {
-    background-color: #2E86AB !important;
-    color: #FFFFFF !important;
-}
+def initialize_session_state():
+    """Initialize session state variables."""
+    ss = st.session_state
+    ss.setdefault('recommendation', None)
+    ss.setdefault('inputs', None)
+    ss.setdefault('rule_explanation', None)
+
+
+def reset_state():
+    """Clear the stored recommendation (Reset All button callback)."""
+    ss = st.session_state
+    for key in ("recommendation", "inputs", "rule_explanation"):
+        ss[key] = None
+    st.toast("Reset complete", icon="🔄")
+
+
+@st.cache_data(persist="disk", max_entries=1024, show_spinner=False)
+def compute_recommendation(
+    racks: int,
+    servers: int,
+    budget_usd: float,
+    power_kw: float,
+    workload_value: str,
+    config: tuple
+) -> tuple[TopologyRecommendation, dict]:
+    """
+    Run the full decision pipeline for a set of inputs.
+    
+    Results are memoized by Streamlit on the five scalar inputs plus the
+    decision config (thresholds and weights) and persisted to disk, so
+    resubmitting identical parameters (even after a server restart) skips
+    classification, scoring and explanation generation entirely, while a
+    config change produces a fresh cache key.
+    
+    Args:
+        racks: Number of racks
+        servers: Number of servers
+        budget_usd: Budget in USD
+        power_kw: Power limit in kW
+        workload_value: WorkloadType value selected in the UI
+        config: Thresholds and weights in effect (see _DECISION_CONFIG).
+            Not used directly; it is part of the cache key so that tuning
+            core/config.py or core/scoring.py invalidates persisted results.
+        
+    Returns:
+        Tuple of (TopologyRecommendation, rule explanation dict)
+    """
+    inputs = UserInputs(
+        racks=racks,
+        servers=servers,
+        budget_usd=budget_usd,
+        power_kw=power_kw,
+        workload_type=_WORKLOAD_LOOKUP[workload_value]
+    )
+    
+    # Classify inputs
+    classification = classify_inputs(inputs)
+    
+    # Rule-based recommendation
+    rule_topology = suggest_topology_by_rules(classification)
+    
+    # Scoring-based ranking
+    scores = rank_topologies(inputs, classification)
+    
+    # Get top-scoring topology
+    scored_topology = scores[0].topology
+    
+    # Use rule-based if it matches top score, otherwise use top score
+    # (Rule-based takes precedence as per requirements)
+    final_topology = rule_topology
+    confidence = 0.8 if rule_topology == scored_topology else 0.7
+    
+    # Generate explanation
+    explanation = generate_explanation(final_topology, classification, rule_based=True)
+    
+    # Get rule explanation for explainability
+    rule_explanation = explain_rule_application(classification)
+    
+    # Create recommendation
+    recommendation = TopologyRecommendation(
+        topology=final_topology,
+        confidence=confidence,
+        explanation=explanation,
+        scores=scores,
+        classification=classification
+    )
+    
+    return recommendation, rule_explanation
 
-[data-testid="stDataFrame"] [role="button"] svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
 
-/* DATAFRAME TOOLBAR BUTTONS */
-.dataframe-toolbar button,
-.dataframe-controls button,
-[class*="dataframe"] button {
-    background-color: #2E86AB !important;
-    color: #FFFFFF !important;
-}
+@st.cache_resource(show_spinner=False)
+def cached_topology_characteristics(topology_value: str) -> TopologyCharacteristics:
+    """
+    Memoized get_topology_characteristics keyed on the topology value.
+    
+    Uses st.cache_resource: the catalog entry is read-only reference data,
+    so it is shared instead of unpickled into a fresh copy on every hit.
+    """
+    return get_topology_characteristics(TopologyType(topology_value))
 
-[class*="dataframe"] button svg,
-.dataframe-toolbar button svg,
-.dataframe-controls button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
 
-/* GENERIC ICON FIXES */
-svg {
-    fill: currentColor !important;
-    stroke: currentColor !important;
-}
+@st.cache_data(show_spinner=False)
+def cached_comparison_dataframe() -> "pd.DataFrame":
+    """Memoized topology comparison table (static for the process lifetime)."""
+    from visualization.charts import create_comparison_dataframe
+    
+    return create_comparison_dataframe()
 
-button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
 
-/* FULLSCREEN BUTTON - BLACK BACKGROUND, WHITE ICON */
-[data-testid="stFullScreenFrame"] button,
-[title="View fullscreen"],
-[aria-label="View fullscreen"],
-button[title*="fullscreen"],
-button[aria-label*="fullscreen"],
-.stPlotlyChart button,
-.element-container button[title*="View"],
-[data-testid="stPlotlyChart"] button {
-    background-color: #000000 !important;
-    color: #FFFFFF !important;
-    border: 1px solid #333333 !important;
-    border-radius: 4px !important;
-    padding: 4px !important;
-}
+def _figure_png(fig) -> bytes:
+    """
+    Rasterize a matplotlib Figure with the same options st.pyplot uses.
+    
+    The chart helpers below cache these bytes, so reruns send the stored
+    image with st.image instead of re-rendering the Figure every time.
+    """
+    import io
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
 
-[data-testid="stFullScreenFrame"] button svg,
-[title="View fullscreen"] svg,
-[aria-label="View fullscreen"] svg,
-button[title*="fullscreen"] svg,
-button[aria-label*="fullscreen"] svg,
-.stPlotlyChart button svg,
-.element-container button[title*="View"] svg,
-[data-testid="stPlotlyChart"] button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
 
-/* CHART CONTROL BUTTONS */
-.js-plotly-plot .modebar {
-    background-color: rgba(0, 0, 0, 0.8) !important;
-}
+@st.cache_resource(max_entries=64, show_spinner=False)
+def cached_topology_graph(topology_value: str, racks: int) -> bytes:
+    """
+    Memoized topology diagram (PNG bytes) keyed on topology value and rack count.
+    
+    Uses st.cache_resource: the bytes are immutable, so they are shared
+    rather than pickled and copied on every cache hit.
+    """
+    from visualization.graphs import draw_topology_graph
+    
+    return _figure_png(draw_topology_graph(TopologyType(topology_value), racks))
 
-.js-plotly-plot .modebar-btn {
-    background-color: #000000 !important;
-    color: #FFFFFF !important;
-    border: 1px solid #333333 !important;
-}
 
-.js-plotly-plot .modebar-btn svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-}
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_score_comparison_chart(scores_key: tuple, _scores: list[TopologyScore]) -> bytes:
+    """
+    Memoized score comparison chart (PNG bytes).
+    
+    Args:
+        scores_key: Hashable (topology value, rounded score) pairs
+        _scores: Ranked TopologyScore list (not hashed by Streamlit)
+    """
+    from visualization.charts import create_score_comparison_chart
+    
+    return _figure_png(create_score_comparison_chart(_scores))
 
-.js-plotly-plot .modebar-btn:hover {
-    background-color: #333333 !important;
-}
 
-/* MATPLOTLIB TOOLBAR BUTTONS */
-.toolbar button {
-    background-color: #000000 !important;
-    color: #FFFFFF !important;
-    border: 1px solid #333333 !important;
-}
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_score_breakdown_chart(score_key: tuple, _score: TopologyScore) -> bytes:
+    """
+    Memoized score breakdown chart (PNG bytes).
+    
+    Args:
+        score_key: Hashable (topology value, breakdown items) pair
+        _score: TopologyScore to chart (not hashed by Streamlit)
+    """
+    from visualization.charts import create_score_breakdown_chart
+    
+    return _figure_png(create_score_breakdown_chart(_score))
 
-.toolbar button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-}
 
-/* STREAMLIT CONTROL BUTTONS */
-[data-testid*="button"] svg,
-[data-testid*="Button"] svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-    color: #FFFFFF !important;
-}
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_score_dataframe(scores_key: tuple, _scores: list[TopologyScore]) -> "pd.DataFrame":
+    """
+    Memoized scoring transparency table.
+    
+    Args:
+        scores_key: Hashable (topology value, score, breakdown items) triples
+        _scores: Ranked TopologyScore list (not hashed by Streamlit)
+        
+    Returns:
+        DataFrame with one row per topology and one column per criterion
+    """
+    import pandas as pd
+    
+    # Breakdown values look like "0.90 (30%)"; keep the score part
+    return pd.DataFrame([
+        {
+            "Topology": score.topology.value,
+            **{
+                column: score.breakdown[key].partition(" ")[0] if key in score.breakdown else None
+                for key, column in _BREAKDOWN_COLUMNS.items()
+            },
+            "Total Score": f"{score.score:.3f}"
+        }
+        for score in _scores
+    ])
 
-/* ULTIMATE FALLBACK */
-div, span, p, label, input, textarea, select, button, a, li, td, th {
-    color: #000000 !important;
-}
-</style>
 
-<script>
-// Simplified JavaScript fix
-function fixVisibility() {
-    // Fix selectboxes
-    document.querySelectorAll('[data-baseweb="select"] *').forEach(el => {
-        el.style.setProperty('color', '#000000', 'important');
-        el.style.setProperty('background-color', '#FFFFFF', 'important');
-    });
+@st.cache_resource(show_spinner=False)
+def cached_weights_dataframe(weights: dict[str, float]) -> "pd.DataFrame":
+    """
+    Memoized scoring weights table.
     
-    // Fix dropdowns
-    document.querySelectorAll('[data-baseweb="popover"] *').forEach(el => {
-        el.style.setProperty('color', '#000000', 'important');
-        el.style.setProperty('background-color', '#FFFFFF', 'important');
-    });
+    Uses st.cache_resource: the table is only displayed, never modified,
+    so one shared DataFrame is returned instead of an unpickled copy.
     
-    // Fix number input +/- buttons
-    document.querySelectorAll('.stNumberInput button').forEach(button => {
-        button.style.setProperty('background-color', '#333333', 'important');
-        button.style.setProperty('color', '#FFFFFF', 'important');
-        button.style.setProperty('border', '1px solid #555555', 'important');
-        
-        // Add hover effect
-        button.addEventListener('mouseenter', function() {
-            this.style.setProperty('background-color', '#dc3545', 'important');
-        });
-        
-        button.addEventListener('mouseleave', function() {
-            this.style.setProperty('background-color', '#333333', 'important');
-        });
+    Args:
+        weights: Criterion weights (SCORING_WEIGHTS), also the cache key
         
-        const svg = button.querySelector('svg');
-        if (svg) {
-            svg.style.setProperty('fill', '#FFFFFF', 'important');
-            svg.style.setProperty('stroke', '#FFFFFF', 'important');
-            svg.style.setProperty('color', '#FFFFFF', 'important');
-        }
-    });
+    Returns:
+        DataFrame with Criterion and Weight (percentage) columns
+    """
+    import pandas as pd
     
-    // Fix help/info icons
-    document.querySelectorAll('[data-testid="stTooltipIcon"]').forEach(icon => {
-        icon.style.setProperty('background-color', '#e9ecef', 'important');
-        icon.style.setProperty('border', '1px solid #ced4da', 'important');
-        icon.style.setProperty('border-radius', '50%', 'important');
-        icon.style.setProperty('color', '#000000', 'important');
-        icon.style.setProperty('width', '20px', 'important');
-        icon.style.setProperty('height', '20px', 'important');
-        icon.style.setProperty('display', 'flex', 'important');
-        icon.style.setProperty('align-items', 'center', 'important');
-        icon.style.setProperty('justify-content', 'center', 'important');
-        icon.style.setProperty('font-size', '12px', 'important');
-        icon.style.setProperty('font-weight', 'bold', 'important');
-        
-        // Hide the SVG and add text "i"
-        const svg = icon.querySelector('svg');
-        if (svg) {
-            svg.style.display = 'none';
-        }
-        
-        // Add "i" text if not already present
-        if (!icon.textContent || icon.textContent.trim() === '') {
-            icon.textContent = 'i';
-            icon.style.setProperty('font-style', 'italic', 'important');
-        }
-    });
+    weight_data = {
+        "Criterion": ["Scale Match", "Budget Match", "Power Match", "Workload Suitability", "Scalability Match"],
+        "Weight": [
+            f"{weights['scale_match']*100:.0f}%",
+            f"{weights['budget_match']*100:.0f}%",
+            f"{weights['power_match']*100:.0f}%",
+            f"{weights['workload_suitability']*100:.0f}%",
+            f"{weights['scalability_match']*100:.0f}%"
+        ]
+    }
+    return pd.DataFrame(weight_data)
+
+
+def highlight_recommended_rows(df: "pd.DataFrame", topology_name: str) -> "pd.DataFrame":
+    """
+    Build a Styler CSS matrix highlighting the recommended topology's row.
     
-    // Fix control button icons
-    document.querySelectorAll('button svg').forEach(svg => {
-        const button = svg.closest('button');
-        if (button && (button.title?.includes('fullscreen') || button.closest('[data-testid="stDataFrame"]'))) {
-            svg.style.setProperty('fill', '#FFFFFF', 'important');
-            svg.style.setProperty('stroke', '#FFFFFF', 'important');
-        }
-    });
-}
-
-// Run fix
-fixVisibility();
-setTimeout(fixVisibility, 500);
-new MutationObserver(fixVisibility).observe(document.body, { childList: true, subtree: true });
-document.addEventListener('click', () => setTimeout(fixVisibility, 50));
-setInterval(fixVisibility, 2000);
-</script>
-""", unsafe_allow_html=True)
-
-
-def initialize_session_state():
-    """Initialize session state variables."""
-    if 'recommendation' not in st.session_state:
-        st.session_state.recommendation = None
-    if 'inputs' not in st.session_state:
-        st.session_state.inputs = None
+    Used with Styler.apply(axis=None) so the whole table is styled from one
+    boolean mask instead of one Python callback per row.
+    
+    Args:
+        df: Table with a "Topology" column
+        topology_name: Topology value to highlight
+        
+    Returns:
+        DataFrame of CSS strings with the same shape as df
+    """
+    import numpy as np
+    import pandas as pd
+    
+    mask = (df["Topology"] == topology_name).to_numpy()
+    css = np.where(mask[:, None], "background-color: #d4edda", "")
+    return pd.DataFrame(
+        np.broadcast_to(css, df.shape), index=df.index, columns=df.columns
+    )
 
 
 def main():
     """Main application function."""
+    inject_styles()
     initialize_session_state()
+    ss = st.session_state
     
     # Header with clean minimal styling
-    st.markdown("""
-    <div style='padding: 20px 0; margin-bottom: 30px; border-bottom: 2px solid #e9ecef;'>
-        <h1 style='color: #1a1a1a; margin: 0; padding: 0; border: none; font-size: 2rem; font-weight: 600;'>
-            🌐 Adaptive Topology Selection in Data Center Networks
-        </h1>
-        <p style='color: #6c757d; margin-top: 8px; font-size: 1rem; margin-bottom: 0;'>
-            Academic Decision-Support System for Network Topology Planning
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Reset button in header area
     col1, col2, col3 = st.columns([1, 1, 1])
     with col3:
-        if st.button("🔄 Reset All", use_container_width=True, type="secondary"):
-            st.session_state.recommendation = None
-            st.session_state.inputs = None
-            st.session_state.rule_explanation = None
-            st.rerun()
+        # Callback runs before the script reruns, so no st.rerun() is needed
+        st.button(
+            "🔄 Reset All",
+            use_container_width=True,
+            type="secondary",
+            on_click=reset_state
+        )
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Input Section with clean minimal layout
-    st.markdown("""
-    <div style='margin-bottom: 25px;'>
-        <h2 style='margin-top: 0; padding-left: 8px; border-left: 3px solid #2E86AB; color: #2E86AB; font-size: 1.5rem;'>
-            📊 Input Parameters
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(INPUT_SECTION_HTML, unsafe_allow_html=True)
     
     with st.expander("📝 Enter Data Center Requirements", expanded=True):
-        st.markdown("""
-        <p style='color: #495057; font-size: 14px; margin-bottom: 20px;'>
-            Please provide the following information about your data center deployment:
-        </p>
-        """, unsafe_allow_html=True)
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            <p style='color: #495057; font-weight: 600; font-size: 14px; margin-bottom: 12px;'>
-                Infrastructure Scale
-            </p>
-            """, unsafe_allow_html=True)
-            racks = st.number_input(
-                "Number of Racks",
-                min_value=1,
-                max_value=10000,
-                value=12,
-                step=1,
-                help="Total number of server racks in the data center",
-                key="racks_input"
-            )
+        with st.form("dc_inputs", clear_on_submit=False):
+            st.markdown(INPUT_INTRO_HTML, unsafe_allow_html=True)
             
-            servers = st.number_input(
-                "Number of Servers",
-                min_value=1,
-                max_value=1000000,
-                value=480,
-                step=1,
-                help="Total number of servers to be deployed",
-                key="servers_input"
-            )
-        
-        with col2:
-            st.markdown("""
-            <p style='color: #495057; font-weight: 600; font-size: 14px; margin-bottom: 12px;'>
-                Resource Constraints
-            </p>
-            """, unsafe_allow_html=True)
-            budget_usd = st.number_input(
-                "Budget (USD)",
-                min_value=0.0,
-                max_value=1000000000.0,
-                value=250000.0,
-                step=10000.0,
-                format="%.0f",
-                help="Total budget available for network infrastructure",
-                key="budget_input"
-            )
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown(SCALE_LABEL_HTML, unsafe_allow_html=True)
+                racks = st.number_input(
+                    "Number of Racks",
+                    min_value=1,
+                    max_value=10000,
+                    value=12,
+                    step=1,
+                    help="Total number of server racks in the data center",
+                    key="racks_input"
+                )
+            
+                servers = st.number_input(
+                    "Number of Servers",
+                    min_value=1,
+                    max_value=1000000,
+                    value=480,
+                    step=1,
+                    help="Total number of servers to be deployed",
+                    key="servers_input"
+                )
+            
+            with col2:
+                st.markdown(CONSTRAINTS_LABEL_HTML, unsafe_allow_html=True)
+                budget_usd = st.number_input(
+                    "Budget (USD)",
+                    min_value=0.0,
+                    max_value=1000000000.0,
+                    value=250000.0,
+                    step=10000.0,
+                    format="%.0f",
+                    help="Total budget available for network infrastructure",
+                    key="budget_input"
+                )
+            
+                power_kw = st.number_input(
+                    "Power Limit (kW)",
+                    min_value=0.1,
+                    max_value=100000.0,
+                    value=30.0,
+                    step=1.0,
+                    format="%.1f",
+                    help="Maximum power consumption limit in kilowatts",
+                    key="power_input"
+                )
             
-            power_kw = st.number_input(
-                "Power Limit (kW)",
-                min_value=0.1,
-                max_value=100000.0,
-                value=30.0,
-                step=1.0,
-                format="%.1f",
-                help="Maximum power consumption limit in kilowatts",
-                key="power_input"
+            st.markdown(WORKLOAD_LABEL_HTML, unsafe_allow_html=True)
+            workload_type = st.selectbox(
+                "**Workload Type**",
+                options=_WORKLOAD_OPTIONS,
+                help="Type of workload that will run on the infrastructure",
+                key="workload_input"
             )
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown("""
-         <p style='color: #495057; font-weight: 600; font-size: 14px; margin-bottom: 12px;'>
-             Workload Configuration
-         </p>
-         """, unsafe_allow_html=True)
-        workload_type = st.selectbox(
-            "**Workload Type**",
-            options=[wt.value for wt in WorkloadType],
-            help="Type of workload that will run on the infrastructure",
-            key="workload_input"
-        )
-        
-        # Validation
-        is_valid, error_msg = validate_all_inputs(racks, servers, budget_usd, power_kw)
-        
-        if not is_valid:
-            st.error(f"❌ Validation Error: {error_msg}")
-            return
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Process inputs with improved button
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🔍 Analyze & Recommend Topology", type="primary", use_container_width=True):
-                try:
-                    inputs = UserInputs(
-                        racks=int(racks),
-                        servers=int(servers),
-                        budget_usd=float(budget_usd),
-                        power_kw=float(power_kw),
-                        workload_type=WorkloadType(workload_type)
-                    )
-                    
-                    # Classify inputs
-                    classification = classify_inputs(inputs)
-                    
-                    # Rule-based recommendation
-                    rule_topology = suggest_topology_by_rules(classification)
-                    
-                    # Scoring-based ranking
-                    scores = rank_topologies(inputs, classification)
-                    
-                    # Get top-scoring topology
-                    scored_topology = scores[0].topology
-                    
-                    # Use rule-based if it matches top score, otherwise use top score
-                    # (Rule-based takes precedence as per requirements)
-                    final_topology = rule_topology
-                    confidence = 0.8 if rule_topology == scored_topology else 0.7
-                    
-                    # Generate explanation
-                    explanation = generate_explanation(final_topology, classification, rule_based=True)
-                    
-                    # Get rule explanation for explainability
-                    rule_explanation = explain_rule_application(classification)
-                    
-                    # Create recommendation
-                    recommendation = TopologyRecommendation(
-                        topology=final_topology,
-                        confidence=confidence,
-                        explanation=explanation,
-                        scores=scores,
-                        classification=classification
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # Widgets inside the form only propagate on submit, so editing
+            # a value no longer reruns the whole script
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                submitted = st.form_submit_button(
+                    "🔍 Analyze & Recommend Topology",
+                    type="primary",
+                    use_container_width=True
+                )
+        
+        if submitted:
+            # Validation (widget-bounded values skip the full validator)
+            if _fast_valid(racks, servers, budget_usd, power_kw):
+                is_valid, error_msg = True, None
+            else:
+                is_valid, error_msg = validate_all_inputs(racks, servers, budget_usd, power_kw)
+            
+            if not is_valid:
+                st.error(f"❌ Validation Error: {error_msg}")
+                return
+            
+            try:
+                new_inputs = UserInputs(
+                    racks=int(racks),
+                    servers=int(servers),
+                    budget_usd=float(budget_usd),
+                    power_kw=float(power_kw),
+                    workload_type=_WORKLOAD_LOOKUP[workload_type]
+                )
+                
+                # Resubmitting unchanged inputs keeps the current result
+                if ss.recommendation is None or ss.inputs != new_inputs:
+                    recommendation, rule_explanation = compute_recommendation(
+                        new_inputs.racks,
+                        new_inputs.servers,
+                        new_inputs.budget_usd,
+                        new_inputs.power_kw,
+                        workload_type,
+                        _DECISION_CONFIG
                     )
                     
-                    st.session_state.recommendation = recommendation
-                    st.session_state.inputs = inputs
-                    st.session_state.rule_explanation = rule_explanation
-                    
-                except Exception as e:
-                    st.error(f"❌ Error processing inputs: {str(e)}")
-                    return
+                    ss.recommendation = recommendation
+                    ss.inputs = new_inputs
+                    ss.rule_explanation = rule_explanation
+                
+            except Exception as e:
+                st.error(f"❌ Error processing inputs: {str(e)}")
+                return
     
     # Display results if available
-    if st.session_state.recommendation is not None:
-        recommendation = st.session_state.recommendation
-        inputs = st.session_state.inputs
-        
-        st.markdown("---")
-        
-        # Recommendation Section - Clean minimal design
-        st.markdown("""
-        <div style='margin-bottom: 25px;'>
-            <h2 style='margin-top: 0; padding-left: 8px; border-left: 3px solid #2E86AB; color: #2E86AB; font-size: 1.5rem;'>
-                🎯 Topology Recommendation
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Highlight recommended topology - Clean card design
-        st.markdown(f"""
-        <div style='background-color: #ffffff; 
-                    padding: 20px; 
-                    border-radius: 4px; 
-                    border: 1px solid #28a745;
-                    margin-bottom: 20px;'>
-            <h3 style='color: #28a745; margin-top: 0; font-size: 1.3rem; font-weight: 600;'>
-                ✅ Recommended: {recommendation.topology.value}
-            </h3>
-            <p style='font-size: 15px; color: #495057; margin-bottom: 0;'>
-                <strong>Confidence:</strong> <span style='color: #28a745; font-weight: 600;'>{recommendation.confidence:.0%}</span>
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    if ss.recommendation is not None:
+        recommendation = ss.recommendation
+        inputs = ss.inputs
+        
+        # Bind frequently interpolated values once for the whole render
+        cls = recommendation.classification
+        scale_v, budget_v, power_v = cls.scale.value, cls.budget.value, cls.power.value
+        topo_v = recommendation.topology.value
+        scores_by_topo = {s.topology: s for s in recommendation.scores}
+        
+        # Recommendation Section header and recommended topology card
+        st.markdown(
+            "---\n" + RECOMMENDATION_SECTION_HTML
+            + RECOMMENDED_CARD_TMPL.format(
+                topology=topo_v,
+                confidence=recommendation.confidence
+            ),
+            unsafe_allow_html=True
+        )
         
         # Metrics in a row
-        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        rec_col1, rec_col2, rec_col3 = st.columns(3, gap="small")
         
         with rec_col1:
-            st.metric("Scale Classification", recommendation.classification.scale.value)
+            st.metric("Scale Classification", scale_v)
         
         with rec_col2:
-            st.metric("Budget Classification", recommendation.classification.budget.value)
+            st.metric("Budget Classification", budget_v)
         
         with rec_col3:
-            st.metric("Power Classification", recommendation.classification.power.value)
+            st.metric("Power Classification", power_v)
         
         # Classification Results (Prominently Displayed) with enhanced cards
         st.subheader("📋 Input Classification Results")
-        st.markdown("**Your inputs have been classified into the following categories:**")
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        class_col1, class_col2, class_col3 = st.columns(3)
-        with class_col1:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #e7f3ff 0%, #d0e7ff 100%); 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        border-left: 5px solid #2E86AB;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                        height: 100%;'>
-                <h4 style='margin: 0 0 10px 0; color: #2E86AB; font-size: 16px;'>📏 Scale Classification</h4>
-                <p style='font-size: 24px; font-weight: 700; margin: 15px 0; color: #1e5f7a;'>{recommendation.classification.scale.value}</p>
-                <p style='font-size: 13px; color: #666; margin: 0; line-height: 1.5;'>
-                    <strong>Based on:</strong><br>
-                    {inputs.racks} racks<br>
-                    {inputs.servers} servers
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        with class_col2:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #fff4e6 0%, #ffe8cc 100%); 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        border-left: 5px solid #F77F00;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                        height: 100%;'>
-                <h4 style='margin: 0 0 10px 0; color: #F77F00; font-size: 16px;'>💰 Budget Classification</h4>
-                <p style='font-size: 24px; font-weight: 700; margin: 15px 0; color: #cc6600;'>{recommendation.classification.budget.value}</p>
-                <p style='font-size: 13px; color: #666; margin: 0; line-height: 1.5;'>
-                    <strong>Budget:</strong><br>
-                    ${inputs.budget_usd:,.0f} USD
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        with class_col3:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%); 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        border-left: 5px solid #06B6D4;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                        height: 100%;'>
-                <h4 style='margin: 0 0 10px 0; color: #06B6D4; font-size: 16px;'>⚡ Power Classification</h4>
-                <p style='font-size: 24px; font-weight: 700; margin: 15px 0; color: #0891b2;'>{recommendation.classification.power.value}</p>
-                <p style='font-size: 13px; color: #666; margin: 0; line-height: 1.5;'>
-                    <strong>Power Limit:</strong><br>
-                    {inputs.power_kw:.1f} kW
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(
+            "**Your inputs have been classified into the following categories:**\n\n<br>",
+            unsafe_allow_html=True
+        )
         
-        st.markdown("---")
+        cards = [
+            CLASS_CARD_TMPL.format(
+                bg_from="#e7f3ff", bg_to="#d0e7ff", accent="#2E86AB", value_color="#1e5f7a",
+                title="📏 Scale Classification", value=scale_v,
+                basis_label="Based on:", basis=f"{inputs.racks} racks<br>{inputs.servers} servers"
+            ),
+            CLASS_CARD_TMPL.format(
+                bg_from="#fff4e6", bg_to="#ffe8cc", accent="#F77F00", value_color="#cc6600",
+                title="💰 Budget Classification", value=budget_v,
+                basis_label="Budget:", basis=f"${inputs.budget_usd:,.0f} USD"
+            ),
+            CLASS_CARD_TMPL.format(
+                bg_from="#f0f9ff", bg_to="#e0f2fe", accent="#06B6D4", value_color="#0891b2",
+                title="⚡ Power Classification", value=power_v,
+                basis_label="Power Limit:", basis=f"{inputs.power_kw:.1f} kW"
+            ),
+        ]
+        st.markdown(
+            "<div style='display: flex; gap: 1rem; align-items: stretch;'>"
+            + "".join(cards)
+            + "</div>",
+            unsafe_allow_html=True
+        )
         
         # Explain Decision Section (MANDATORY for viva)
-        st.markdown("""
-        <div style='background-color: #ffffff; 
-                    padding: 20px; 
-                    border-radius: 8px; 
-                    border: 1px solid #dee2e6;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                    margin-bottom: 20px;'>
-            <h2 style='margin-top: 0; padding-left: 0; border-left: none; color: #2E86AB;'>
-                🔍 Explain Decision
-            </h2>
-            <p style='color: #6c757d; margin-bottom: 0;'>
-                Detailed explanation of the decision-making process for academic evaluation
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown("---\n" + EXPLAIN_SECTION_HTML, unsafe_allow_html=True)
         
         with st.expander("📖 Decision Logic Explanation", expanded=True):
-            rule_expl = st.session_state.get('rule_explanation', {})
+            rule_expl = ss.get('rule_explanation', {})
             
             if rule_expl:
-                st.markdown("""
-                <div style='background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #2E86AB;'>
-                    <h3 style='color: #2E86AB; margin-top: 0; font-weight: 600;'>Rule-Based Decision Process</h3>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Show which rule fired
-                st.markdown(f"""
-                <div style='background-color: #e7f3ff; padding: 15px; border-radius: 6px; margin-bottom: 15px;'>
-                    <p style='color: #212529; margin: 0; font-size: 15px;'>
-                        <strong style='color: #2E86AB;'>Rule Applied:</strong> 
-                        <span style='color: #212529; font-weight: 600;'>Rule #{rule_expl.get('fired_rule', 'N/A')}</span>
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+                # Section header and the rule that fired
+                st.markdown(
+                    RULE_PROCESS_HTML
+                    + RULE_APPLIED_TMPL.format(rule=rule_expl.get('fired_rule', 'N/A')),
+                    unsafe_allow_html=True
+                )
                 
                 # Show conditions
                 conditions = rule_expl.get('rule_conditions', [])
                 if conditions:
-                    st.markdown("""
-                    <p style='color: #212529; font-weight: 600; font-size: 15px; margin-bottom: 10px;'>
-                        Conditions that triggered this rule:
-                    </p>
-                    """, unsafe_allow_html=True)
-                    for condition in conditions:
-                        st.markdown(f"""
-                        <div style='background-color: #ffffff; padding: 10px 15px; border-radius: 5px; margin-bottom: 8px; border-left: 3px solid #28a745;'>
-                            <p style='color: #212529; margin: 0; font-size: 14px;'>
-                                ✓ <strong style='color: #212529;'>{condition}</strong>
-                            </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                st.markdown("<br>", unsafe_allow_html=True)
+                    st.markdown(
+                        CONDITIONS_LABEL_HTML
+                        + "\n".join(CONDITION_TMPL.format(condition=c) for c in conditions),
+                        unsafe_allow_html=True
+                    )
                 
                 # Why other topologies were not selected
-                st.markdown("""
-                <div style='background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #F77F00;'>
-                    <h3 style='color: #F77F00; margin-top: 0; font-weight: 600;'>Why Other Topologies Were Not Selected</h3>
-                </div>
-                """, unsafe_allow_html=True)
                 why_not = rule_expl.get('why_not_others', {})
-                for topology_name, reason in why_not.items():
-                    st.markdown(f"""
-                    <div style='background-color: #ffffff; padding: 15px; border-radius: 6px; margin-bottom: 15px; border: 1px solid #dee2e6;'>
-                        <p style='color: #212529; margin: 0 0 8px 0; font-weight: 600; font-size: 15px;'>
-                            <strong style='color: #2E86AB;'>{topology_name}:</strong>
-                        </p>
-                        <p style='color: #495057; margin: 0; font-size: 14px; line-height: 1.6;'>
-                            {reason}
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                st.markdown(
+                    "<br>" + WHY_NOT_HEADER_HTML
+                    + "\n".join(
+                        WHYNOT_TMPL.format(name=name, reason=reason)
+                        for name, reason in why_not.items()
+                    ),
+                    unsafe_allow_html=True
+                )
             
-            st.markdown("<br>", unsafe_allow_html=True)
-            st.markdown("""
-            <div style='background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #28a745;'>
-                <h3 style='color: #28a745; margin-top: 0; font-weight: 600;'>Plain-English Summary</h3>
-            </div>
-            """, unsafe_allow_html=True)
-            st.markdown(f"""
-            <div style='background-color: #ffffff; padding: 20px; border-radius: 6px; border: 1px solid #dee2e6;'>
-                <p style='color: #212529; margin: 0; font-size: 15px; line-height: 1.7;'>
-                    {recommendation.explanation}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                "<br>" + SUMMARY_HEADER_HTML
+                + SUMMARY_TMPL.format(explanation=recommendation.explanation),
+                unsafe_allow_html=True
+            )
         
         # Topology Characteristics
-        characteristics = get_topology_characteristics(recommendation.topology)
+        characteristics = cached_topology_characteristics(topo_v)
         
         with st.expander("📋 Topology Characteristics", expanded=False):
             st.markdown(f"**Description:** {characteristics.description}")
@@ -1298,228 +616,110 @@ def main():
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown("**Advantages:**")
-                for adv in characteristics.advantages:
-                    st.markdown(f"- {adv}")
+                st.markdown("**Advantages:**\n\n" + "\n".join(
+                    f"- {adv}" for adv in characteristics.advantages
+                ))
             
             with col2:
-                st.markdown("**Disadvantages:**")
-                for disadv in characteristics.disadvantages:
-                    st.markdown(f"- {disadv}")
+                st.markdown("**Disadvantages:**\n\n" + "\n".join(
+                    f"- {disadv}" for disadv in characteristics.disadvantages
+                ))
             
-            st.markdown("**Typical Use Cases:**")
-            for use_case in characteristics.typical_use_cases:
-                st.markdown(f"- {use_case}")
-        
-        st.markdown("---")
+            st.markdown("**Typical Use Cases:**\n\n" + "\n".join(
+                f"- {use_case}" for use_case in characteristics.typical_use_cases
+            ))
         
         # Visualization Section
-        st.markdown("""
-        <div style='background-color: #ffffff; 
-                    padding: 20px; 
-                    border-radius: 8px; 
-                    border: 1px solid #dee2e6;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                    margin-bottom: 20px;'>
-            <h2 style='margin-top: 0; padding-left: 0; border-left: none; color: #2E86AB;'>
-                📈 Analysis & Visualization
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            "---\n" + SECTION_CARD_TMPL.format(title="📈 Analysis & Visualization", body=""),
+            unsafe_allow_html=True
+        )
         
         # Topology Graph
         st.subheader("Network Topology Diagram")
         st.caption("**Note:** These diagrams are logical abstractions showing network structure, not physical hardware layouts. They represent the connectivity patterns and hierarchical relationships between network layers.")
         with st.spinner("Generating topology diagram..."):
-            fig = draw_topology_graph(recommendation.topology, inputs.racks)
-            st.pyplot(fig, use_container_width=True)
+            # Rack counts past the diagram limit render identically, so
+            # clamp first and let them share one cache entry
+            from visualization.graphs import MAX_DIAGRAM_RACKS
+            topology_png = cached_topology_graph(topo_v, min(inputs.racks, MAX_DIAGRAM_RACKS))
+            st.image(topology_png, use_container_width=True)
         
         # Score Comparison
         st.subheader("Topology Score Comparison")
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            score_fig = create_score_comparison_chart(recommendation.scores)
-            st.pyplot(score_fig, use_container_width=True)
+            score_png = cached_score_comparison_chart(
+                tuple((s.topology.value, round(s.score, 4)) for s in recommendation.scores),
+                recommendation.scores
+            )
+            st.image(score_png, use_container_width=True)
         
         with col2:
-            st.markdown("**Score Ranking:**")
-            for i, score in enumerate(recommendation.scores, 1):
-                marker = "🥇" if i == 1 else "🥈" if i == 2 else "🥉"
-                st.markdown(f"{marker} **{i}.** {score.topology.value}: {score.score:.2f}")
+            ranking_lines = ["**Score Ranking:**"] + [
+                f"{_RANK_MARKERS[min(i, 3) - 1]} **{i}.** {score.topology.value}: {score.score:.2f}"
+                for i, score in enumerate(recommendation.scores, 1)
+            ]
+            st.markdown("\n\n".join(ranking_lines))
         
         # Score Breakdown for recommended topology
-        st.subheader(f"Score Breakdown: {recommendation.topology.value}")
-        breakdown_fig = create_score_breakdown_chart(
-            next(s for s in recommendation.scores if s.topology == recommendation.topology)
+        st.subheader(f"Score Breakdown: {topo_v}")
+        recommended_score = scores_by_topo[recommendation.topology]
+        breakdown_png = cached_score_breakdown_chart(
+            (topo_v, tuple(recommended_score.breakdown.items())),
+            recommended_score
         )
-        st.pyplot(breakdown_fig, use_container_width=True)
-        
-        st.markdown("---")
+        st.image(breakdown_png, use_container_width=True)
         
         # Comparison Table
-        st.markdown("""
-        <div style='background-color: #ffffff; 
-                    padding: 20px; 
-                    border-radius: 8px; 
-                    border: 1px solid #dee2e6;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                    margin-bottom: 20px;'>
-            <h2 style='margin-top: 0; padding-left: 0; border-left: none; color: #2E86AB;'>
-                📊 Topology Comparison
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            "---\n" + SECTION_CARD_TMPL.format(title="📊 Topology Comparison", body=""),
+            unsafe_allow_html=True
+        )
         
-        comparison_df = create_comparison_dataframe()
+        comparison_df = cached_comparison_dataframe()
         
         # Highlight recommended topology
-        def highlight_recommended(row):
-            if row['Topology'] == recommendation.topology.value:
-                return ['background-color: #d4edda'] * len(row)
-            return [''] * len(row)
-        
-        styled_df = comparison_df.style.apply(highlight_recommended, axis=1)
+        styled_df = comparison_df.style.apply(
+            highlight_recommended_rows, topology_name=topo_v, axis=None
+        )
         st.dataframe(styled_df, use_container_width=True, hide_index=True)
         
         # Detailed Score Table (Transparency for Academic Evaluation)
         st.subheader("📊 Weighted Scoring Transparency")
         st.markdown("**Complete score breakdown for all topologies (MCDA/AHP-inspired approach)**")
         
-        # Create comprehensive score table
-        score_data = []
-        for score in recommendation.scores:
-            row = {
-                "Topology": score.topology.value,
-                "Scale Score": None,
-                "Budget Score": None,
-                "Power Score": None,
-                "Workload Score": None,
-                "Scalability Score": None,
-                "Total Score": f"{score.score:.3f}"
-            }
-            
-            # Extract individual scores from breakdown
-            for key, value in score.breakdown.items():
-                if key == "Scale Match":
-                    row["Scale Score"] = value.split()[0]
-                elif key == "Budget Match":
-                    row["Budget Score"] = value.split()[0]
-                elif key == "Power Match":
-                    row["Power Score"] = value.split()[0]
-                elif key == "Workload Suitability":
-                    row["Workload Score"] = value.split()[0]
-                elif key == "Scalability Match":
-                    row["Scalability Score"] = value.split()[0]
-            
-            score_data.append(row)
-        
-        score_df = pd.DataFrame(score_data)
+        score_df = cached_score_dataframe(
+            tuple((s.topology.value, s.score, tuple(s.breakdown.items()))
+                  for s in recommendation.scores),
+            recommendation.scores
+        )
         
         # Highlight recommended topology
-        def highlight_recommended_score(row):
-            if row['Topology'] == recommendation.topology.value:
-                return ['background-color: #d4edda'] * len(row)
-            return [''] * len(row)
-        
-        styled_score_df = score_df.style.apply(highlight_recommended_score, axis=1)
+        styled_score_df = score_df.style.apply(
+            highlight_recommended_rows, topology_name=topo_v, axis=None
+        )
         st.dataframe(styled_score_df, use_container_width=True, hide_index=True)
         
         # Show weights
         st.markdown("**Scoring Weights (configurable in `core/scoring.py`):**")
-        from core.scoring import SCORING_WEIGHTS
-        weight_data = {
-            "Criterion": ["Scale Match", "Budget Match", "Power Match", "Workload Suitability", "Scalability Match"],
-            "Weight": [
-                f"{SCORING_WEIGHTS['scale_match']*100:.0f}%",
-                f"{SCORING_WEIGHTS['budget_match']*100:.0f}%",
-                f"{SCORING_WEIGHTS['power_match']*100:.0f}%",
-                f"{SCORING_WEIGHTS['workload_suitability']*100:.0f}%",
-                f"{SCORING_WEIGHTS['scalability_match']*100:.0f}%"
-            ]
-        }
-        weight_df = pd.DataFrame(weight_data)
+        weight_df = cached_weights_dataframe(SCORING_WEIGHTS)
         st.dataframe(weight_df, use_container_width=True, hide_index=True)
         st.caption("Note: Weights are expert-assigned heuristics inspired by MCDA/AHP principles. They can be adjusted in `core/scoring.py`.")
         
-        st.markdown("---")
-        
         # Footer
-        st.markdown("""
-        <div style='text-align: center; color: #6c757d; padding: 20px;'>
-            <p><em>Academic Decision-Support System for Data Center Network Planning</em></p>
-            <p style='font-size: 0.9em;'>This tool uses rule-based logic and weighted scoring for topology recommendation.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown("---\n" + FOOTER_HTML, unsafe_allow_html=True)
     
     else:
         # Show instruction when no recommendation yet
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #e7f3ff 0%, #d0e7ff 100%); 
-                    padding: 30px; 
-                    border-radius: 10px; 
-                    border-left: 5px solid #2E86AB;
-                    margin: 40px 0;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-            <h3 style='color: #2E86AB; margin-top: 0;'>
-                👆 Get Started
-            </h3>
-            <p style='font-size: 16px; color: #495057; line-height: 1.6; margin-bottom: 0;'>
-                Enter the required parameters above and click <strong>'Analyze & Recommend Topology'</strong> to get 
-                personalized topology suggestions based on your data center requirements.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(GET_STARTED_HTML, unsafe_allow_html=True)
         
         # Quick info cards
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown("### 💡 What This Tool Does")
-        info_col1, info_col2, info_col3 = st.columns(3)
-        
-        with info_col1:
-            st.markdown("""
-            <div style='background-color: #ffffff; 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        border: 1px solid #dee2e6;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                        height: 100%;'>
-                <h4 style='color: #2E86AB; margin-top: 0;'>🎯 Smart Recommendations</h4>
-                <p style='color: #6c757d; font-size: 14px; margin-bottom: 0;'>
-                    Get topology recommendations based on rule-based logic and weighted scoring analysis.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with info_col2:
-            st.markdown("""
-            <div style='background-color: #ffffff; 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        border: 1px solid #dee2e6;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                        height: 100%;'>
-                <h4 style='color: #2E86AB; margin-top: 0;'>📊 Detailed Analysis</h4>
-                <p style='color: #6c757d; font-size: 14px; margin-bottom: 0;'>
-                    View comprehensive score breakdowns, comparisons, and visualizations for all topologies.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with info_col3:
-            st.markdown("""
-            <div style='background-color: #ffffff; 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        border: 1px solid #dee2e6;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                        height: 100%;'>
-                <h4 style='color: #2E86AB; margin-top: 0;'>🔍 Explainable Decisions</h4>
-                <p style='color: #6c757d; font-size: 14px; margin-bottom: 0;'>
-                    Understand why each topology was recommended with detailed explanations and rule breakdowns.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(
+            "<br>\n\n### 💡 What This Tool Does\n\n" + INFO_CARDS_HTML,
+            unsafe_allow_html=True
+        )
 
 
 if __name__ == "__main__":
@@ -59,6 +59,18 @@ POWER_THRESHOLDS = {
     # Note: Values between low_max and high_min are classified as "Medium"
 }
 
+# ============================================================================
+# CLASSIFICATION BINS
+# ============================================================================
+# Sorted boundaries derived from the thresholds above, for bisect lookups.
+# bisect.bisect_right(bins, value) gives the category level:
+# 0 = Small/Low, 1 = Medium, 2 = Large/High.
+
+SCALE_RACK_BINS = (SCALE_THRESHOLDS["small_max_racks"], SCALE_THRESHOLDS["large_min_racks"])
+SCALE_SERVER_BINS = (SCALE_THRESHOLDS["small_max_servers"], SCALE_THRESHOLDS["large_min_servers"])
+BUDGET_BINS = (BUDGET_THRESHOLDS["low_max"], BUDGET_THRESHOLDS["high_min"])
+POWER_BINS = (POWER_THRESHOLDS["low_max"], POWER_THRESHOLDS["high_min"])
+
 # ============================================================================
 # DECISION RULE NOTES
 # ============================================================================
@@ -11,6 +11,9 @@ inspired by industry best practices and can be validated against known
 deployment scenarios. Thresholds are configurable via core.config module.
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+
 from core.models import (
     UserInputs,
     ClassificationResult,
@@ -20,9 +23,29 @@ from core.models import (
     PowerCategory
 )
 from core.config import (
-    SCALE_THRESHOLDS,
-    BUDGET_THRESHOLDS,
-    POWER_THRESHOLDS
+    SCALE_RACK_BINS,
+    SCALE_SERVER_BINS,
+    BUDGET_BINS,
+    POWER_BINS
+)
+
+# Category for each bisect_right level over the config bins
+_SCALE_LEVELS = (ScaleCategory.SMALL, ScaleCategory.MEDIUM, ScaleCategory.LARGE)
+_BUDGET_LEVELS = (BudgetCategory.LOW, BudgetCategory.MEDIUM, BudgetCategory.HIGH)
+_POWER_LEVELS = (PowerCategory.LOW, PowerCategory.MEDIUM, PowerCategory.HIGH)
+
+# Why each non-selected topology lost, per fired rule (topology name, reason)
+_WHY_NOT_RULE1 = (
+    ("Leaf-Spine", "Not selected because deployment has constraints (small scale, low budget, or low power) that favor simpler topology"),
+    ("Fat-Tree", "Not selected because Fat-Tree requires large scale AND high budget AND high power, which is not met")
+)
+_WHY_NOT_RULE2 = (
+    ("Three-Tier", "Not selected because Three-Tier is designed for smaller deployments and would be a bottleneck at this scale"),
+    ("Leaf-Spine", "Not selected because deployment has sufficient resources (large scale, high budget, high power) to support Fat-Tree's superior performance")
+)
+_WHY_NOT_RULE3 = (
+    ("Three-Tier", "Not selected because deployment scale/budget/power exceeds Three-Tier's optimal range"),
+    ("Fat-Tree", "Not selected because Fat-Tree requires all three conditions (large scale AND high budget AND high power) to be met simultaneously")
 )
 
 
@@ -47,14 +70,13 @@ def classify_scale(racks: int, servers: int) -> ScaleCategory:
     Returns:
         ScaleCategory classification
     """
-    if (racks < SCALE_THRESHOLDS["small_max_racks"] or 
-        servers < SCALE_THRESHOLDS["small_max_servers"]):
+    rack_level = bisect_right(SCALE_RACK_BINS, racks)
+    server_level = bisect_right(SCALE_SERVER_BINS, servers)
+    
+    # Small if either dimension is small, otherwise the larger of the two
+    if rack_level == 0 or server_level == 0:
         return ScaleCategory.SMALL
-    elif (racks >= SCALE_THRESHOLDS["large_min_racks"] or 
-          servers >= SCALE_THRESHOLDS["large_min_servers"]):
-        return ScaleCategory.LARGE
-    else:
-        return ScaleCategory.MEDIUM
+    return _SCALE_LEVELS[max(rack_level, server_level)]
 
 
 def classify_budget(budget_usd: float) -> BudgetCategory:
@@ -77,12 +99,7 @@ def classify_budget(budget_usd: float) -> BudgetCategory:
     Returns:
         BudgetCategory classification
     """
-    if budget_usd < BUDGET_THRESHOLDS["low_max"]:
-        return BudgetCategory.LOW
-    elif budget_usd >= BUDGET_THRESHOLDS["high_min"]:
-        return BudgetCategory.HIGH
-    else:
-        return BudgetCategory.MEDIUM
+    return _BUDGET_LEVELS[bisect_right(BUDGET_BINS, budget_usd)]
 
 
 def classify_power(power_kw: float) -> PowerCategory:
@@ -105,12 +122,7 @@ def classify_power(power_kw: float) -> PowerCategory:
     Returns:
         PowerCategory classification
     """
-    if power_kw < POWER_THRESHOLDS["low_max"]:
-        return PowerCategory.LOW
-    elif power_kw >= POWER_THRESHOLDS["high_min"]:
-        return PowerCategory.HIGH
-    else:
-        return PowerCategory.MEDIUM
+    return _POWER_LEVELS[bisect_right(POWER_BINS, power_kw)]
 
 
 def classify_inputs(inputs: UserInputs) -> ClassificationResult:
@@ -155,18 +167,35 @@ def suggest_topology_by_rules(classification: ClassificationResult) -> TopologyT
     Returns:
         Suggested TopologyType
     """
+    return _RULE_TABLE[
+        _SCALE_ORDINAL[classification.scale] * 9
+        + _BUDGET_ORDINAL[classification.budget] * 3
+        + _POWER_ORDINAL[classification.power]
+    ]
+
+
+def _apply_rules(
+    scale: ScaleCategory,
+    budget: BudgetCategory,
+    power: PowerCategory
+) -> TopologyType:
+    """
+    Evaluate the three decision rules for one category combination.
+    
+    Only used at import to fill _RULE_TABLE; see suggest_topology_by_rules.
+    """
     # Rule 1: Small OR Low budget OR Low power → Three-Tier
     # This rule fires if ANY constraint suggests a simpler topology
-    if (classification.scale == ScaleCategory.SMALL or
-        classification.budget == BudgetCategory.LOW or
-        classification.power == PowerCategory.LOW):
+    if (scale == ScaleCategory.SMALL or
+        budget == BudgetCategory.LOW or
+        power == PowerCategory.LOW):
         return TopologyType.THREE_TIER
     
     # Rule 2: Large AND High budget AND High power → Fat-Tree
     # This rule requires ALL conditions for high-performance topology
-    if (classification.scale == ScaleCategory.LARGE and
-        classification.budget == BudgetCategory.HIGH and
-        classification.power == PowerCategory.HIGH):
+    if (scale == ScaleCategory.LARGE and
+        budget == BudgetCategory.HIGH and
+        power == PowerCategory.HIGH):
         return TopologyType.FAT_TREE
     
     # Rule 3: Default → Leaf-Spine
@@ -174,6 +203,19 @@ def suggest_topology_by_rules(classification: ClassificationResult) -> TopologyT
     return TopologyType.LEAF_SPINE
 
 
+# suggest_topology_by_rules result for every (scale, budget, power),
+# indexed by scale * 9 + budget * 3 + power enum ordinals
+_SCALE_ORDINAL = {category: i for i, category in enumerate(ScaleCategory)}
+_BUDGET_ORDINAL = {category: i for i, category in enumerate(BudgetCategory)}
+_POWER_ORDINAL = {category: i for i, category in enumerate(PowerCategory)}
+_RULE_TABLE = tuple(
+    _apply_rules(scale, budget, power)
+    for scale in ScaleCategory
+    for budget in BudgetCategory
+    for power in PowerCategory
+)
+
+
 def explain_rule_application(classification: ClassificationResult) -> dict:
     """
     Explain which rule fired and why other topologies were not selected.
@@ -190,53 +232,52 @@ def explain_rule_application(classification: ClassificationResult) -> dict:
         - rule_conditions: Conditions that triggered the rule
         - why_not_others: Explanation for why other topologies weren't selected
     """
-    suggested = suggest_topology_by_rules(classification)
+    fired_rule, conditions, why_not = _explain_cached(
+        classification.scale,
+        classification.budget,
+        classification.power
+    )
     
-    explanation = {
-        "fired_rule": None,
-        "rule_conditions": [],
-        "why_not_others": {}
+    # Fresh containers per call, so callers cannot alter the memoized tables
+    return {
+        "fired_rule": fired_rule,
+        "rule_conditions": list(conditions),
+        "why_not_others": dict(why_not)
     }
+
+
+@lru_cache(maxsize=32)
+def _explain_cached(
+    scale: ScaleCategory,
+    budget: BudgetCategory,
+    power: PowerCategory
+) -> tuple:
+    """
+    Memoized rule explanation for one (scale, budget, power) combination.
     
+    Returns:
+        Tuple of (fired rule number, condition labels, why-not pairs)
+    """
     # Check Rule 1
     rule1_conditions = []
-    if classification.scale == ScaleCategory.SMALL:
+    if scale == ScaleCategory.SMALL:
         rule1_conditions.append("Small scale")
-    if classification.budget == BudgetCategory.LOW:
+    if budget == BudgetCategory.LOW:
         rule1_conditions.append("Low budget")
-    if classification.power == PowerCategory.LOW:
+    if power == PowerCategory.LOW:
         rule1_conditions.append("Low power")
     
     if rule1_conditions:
-        explanation["fired_rule"] = 1
-        explanation["rule_conditions"] = rule1_conditions
-        explanation["why_not_others"] = {
-            "Leaf-Spine": "Not selected because deployment has constraints (small scale, low budget, or low power) that favor simpler topology",
-            "Fat-Tree": "Not selected because Fat-Tree requires large scale AND high budget AND high power, which is not met"
-        }
-        return explanation
+        return 1, tuple(rule1_conditions), _WHY_NOT_RULE1
     
     # Check Rule 2
-    if (classification.scale == ScaleCategory.LARGE and
-        classification.budget == BudgetCategory.HIGH and
-        classification.power == PowerCategory.HIGH):
-        explanation["fired_rule"] = 2
-        explanation["rule_conditions"] = ["Large scale", "High budget", "High power"]
-        explanation["why_not_others"] = {
-            "Three-Tier": "Not selected because Three-Tier is designed for smaller deployments and would be a bottleneck at this scale",
-            "Leaf-Spine": "Not selected because deployment has sufficient resources (large scale, high budget, high power) to support Fat-Tree's superior performance"
-        }
-        return explanation
+    if (scale == ScaleCategory.LARGE and
+        budget == BudgetCategory.HIGH and
+        power == PowerCategory.HIGH):
+        return 2, ("Large scale", "High budget", "High power"), _WHY_NOT_RULE2
     
     # Rule 3 (default)
-    explanation["fired_rule"] = 3
-    explanation["rule_conditions"] = ["Medium scale/budget/power or mixed conditions"]
-    explanation["why_not_others"] = {
-        "Three-Tier": "Not selected because deployment scale/budget/power exceeds Three-Tier's optimal range",
-        "Fat-Tree": "Not selected because Fat-Tree requires all three conditions (large scale AND high budget AND high power) to be met simultaneously"
-    }
-    
-    return explanation
+    return 3, ("Medium scale/budget/power or mixed conditions",), _WHY_NOT_RULE3
 
 
 def generate_explanation(
@@ -255,25 +296,46 @@ def generate_explanation(
     Returns:
         Explanation string
     """
+    return _generate_explanation_cached(
+        topology,
+        classification.scale,
+        classification.budget,
+        classification.power,
+        rule_based
+    )
+
+
+@lru_cache(maxsize=256)
+def _generate_explanation_cached(
+    topology: TopologyType,
+    scale: ScaleCategory,
+    budget: BudgetCategory,
+    power: PowerCategory,
+    rule_based: bool
+) -> str:
+    """
+    Memoized explanation text for one (topology, scale, budget, power,
+    rule_based) combination; the whole space is 162 strings.
+    """
     explanations = {
         TopologyType.THREE_TIER: (
             f"Three-Tier topology is recommended because your deployment "
-            f"is classified as {classification.scale.value} scale with "
-            f"{classification.budget.value} budget and {classification.power.value} power. "
+            f"is classified as {scale.value} scale with "
+            f"{budget.value} budget and {power.value} power. "
             f"This topology is cost-effective for smaller deployments and provides "
             f"adequate performance for traditional workloads."
         ),
         TopologyType.LEAF_SPINE: (
             f"Leaf-Spine topology is recommended as it balances performance, "
-            f"scalability, and cost for your {classification.scale.value} scale "
-            f"deployment with {classification.budget.value} budget. This modern "
+            f"scalability, and cost for your {scale.value} scale "
+            f"deployment with {budget.value} budget. This modern "
             f"architecture offers excellent east-west traffic performance and is "
             f"the industry standard for medium to large data centers."
         ),
         TopologyType.FAT_TREE: (
-            f"Fat-Tree topology is recommended for your {classification.scale.value} "
-            f"scale deployment with {classification.budget.value} budget and "
-            f"{classification.power.value} power. This topology provides maximum "
+            f"Fat-Tree topology is recommended for your {scale.value} "
+            f"scale deployment with {budget.value} budget and "
+            f"{power.value} power. This topology provides maximum "
             f"scalability and performance, making it ideal for high-performance "
             f"computing and large-scale AI/ML workloads."
         )
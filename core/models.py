@@ -46,7 +46,7 @@ class PowerCategory(str, Enum):
     HIGH = "High"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserInputs:
     """
     Container for user-provided input parameters.
@@ -76,7 +76,7 @@ class UserInputs:
             raise ValueError("Power limit must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """
     Result of classifying user inputs into categories.
@@ -91,7 +91,7 @@ class ClassificationResult:
     power: PowerCategory
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopologyScore:
     """
     Weighted score for a topology option.
@@ -106,7 +106,7 @@ class TopologyScore:
     breakdown: dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopologyRecommendation:
     """
     Complete recommendation result for a topology.
@@ -125,7 +125,7 @@ class TopologyRecommendation:
     classification: ClassificationResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopologyCharacteristics:
     """
     Characteristics and properties of a network topology.
@@ -22,6 +22,11 @@ different priorities. For example, if budget is more critical, increase
 budget_match weight and decrease others proportionally.
 """
 
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
 from core.models import (
     UserInputs,
     ClassificationResult,
@@ -32,7 +37,6 @@ from core.models import (
     PowerCategory,
     WorkloadType
 )
-from core.topology import get_topology_characteristics
 
 # ============================================================================
 # SCORING WEIGHTS (Expert-Assigned Heuristics)
@@ -62,6 +66,65 @@ SCORING_WEIGHTS = {
 assert abs(sum(SCORING_WEIGHTS.values()) - 1.0) < 0.001, \
     "Scoring weights must sum to 1.0"
 
+# ============================================================================
+# MATCH MATRICES (Expert-Defined Criterion Scores)
+# ============================================================================
+# Each matrix is indexed [topology, category] using the enum ordinals below.
+# Rows follow TopologyType order (Three-Tier, Leaf-Spine, Fat-Tree); columns
+# follow the category enum order. See the _score_* helpers for rationale.
+# ============================================================================
+
+TOPOLOGY_INDEX = {topology: i for i, topology in enumerate(TopologyType)}
+SCALE_INDEX = {category: i for i, category in enumerate(ScaleCategory)}
+BUDGET_INDEX = {category: i for i, category in enumerate(BudgetCategory)}
+POWER_INDEX = {category: i for i, category in enumerate(PowerCategory)}
+WORKLOAD_INDEX = {workload: i for i, workload in enumerate(WorkloadType)}
+
+# Breakdown label and SCORING_WEIGHTS key for each matrix column used by
+# rank_topologies, in calculate_topology_score order
+_CRITERIA = (
+    ("Scale Match", "scale_match"),
+    ("Budget Match", "budget_match"),
+    ("Power Match", "power_match"),
+    ("Workload Suitability", "workload_suitability"),
+    ("Scalability Match", "scalability_match")
+)
+
+# Columns: Small, Medium, Large
+SCALE_MATCH = np.array([
+    [1.0, 0.6, 0.2],     # Three-Tier
+    [0.5, 0.9, 0.95],    # Leaf-Spine
+    [0.1, 0.4, 1.0]      # Fat-Tree
+])
+
+# Columns: Low, Medium, High
+BUDGET_MATCH = np.array([
+    [1.0, 0.7, 0.3],     # Three-Tier
+    [0.4, 0.9, 0.8],     # Leaf-Spine
+    [0.1, 0.3, 1.0]      # Fat-Tree
+])
+
+# Columns: Low, Medium, High
+POWER_MATCH = np.array([
+    [1.0, 0.6, 0.3],     # Three-Tier
+    [0.5, 0.9, 0.8],     # Leaf-Spine
+    [0.2, 0.4, 1.0]      # Fat-Tree
+])
+
+# Columns: AI Training, Web Services, Storage, Mixed
+WORKLOAD_MATCH = np.array([
+    [0.3, 0.7, 0.8, 0.5],      # Three-Tier
+    [0.8, 0.9, 0.7, 0.95],     # Leaf-Spine
+    [1.0, 0.6, 0.5, 0.7]       # Fat-Tree
+])
+
+# Columns: Small, Medium, Large
+SCALABILITY_MATCH = np.array([
+    [0.9, 0.5, 0.2],     # Three-Tier
+    [0.4, 0.9, 0.95],    # Leaf-Spine
+    [0.2, 0.5, 1.0]      # Fat-Tree
+])
+
 
 def calculate_topology_score(
     topology: TopologyType,
@@ -94,7 +157,6 @@ def calculate_topology_score(
     Returns:
         TopologyScore with calculated score and breakdown
     """
-    characteristics = get_topology_characteristics(topology)
     breakdown = {}
     total_score = 0.0
     
@@ -152,26 +214,7 @@ def _score_scale_match(topology: TopologyType, scale: ScaleCategory) -> float:
     Returns:
         Score between 0.0 and 1.0
     """
-    # Expert-defined match matrix: topology -> scale -> score
-    match_matrix = {
-        TopologyType.THREE_TIER: {
-            ScaleCategory.SMALL: 1.0,
-            ScaleCategory.MEDIUM: 0.6,
-            ScaleCategory.LARGE: 0.2
-        },
-        TopologyType.LEAF_SPINE: {
-            ScaleCategory.SMALL: 0.5,
-            ScaleCategory.MEDIUM: 0.9,
-            ScaleCategory.LARGE: 0.95
-        },
-        TopologyType.FAT_TREE: {
-            ScaleCategory.SMALL: 0.1,
-            ScaleCategory.MEDIUM: 0.4,
-            ScaleCategory.LARGE: 1.0
-        }
-    }
-    
-    return match_matrix[topology][scale]
+    return float(SCALE_MATCH[TOPOLOGY_INDEX[topology], SCALE_INDEX[scale]])
 
 
 def _score_budget_match(topology: TopologyType, budget: BudgetCategory) -> float:
@@ -188,26 +231,7 @@ def _score_budget_match(topology: TopologyType, budget: BudgetCategory) -> float
     Returns:
         Score between 0.0 and 1.0
     """
-    # Expert-defined match matrix: topology -> budget -> score
-    match_matrix = {
-        TopologyType.THREE_TIER: {
-            BudgetCategory.LOW: 1.0,
-            BudgetCategory.MEDIUM: 0.7,
-            BudgetCategory.HIGH: 0.3
-        },
-        TopologyType.LEAF_SPINE: {
-            BudgetCategory.LOW: 0.4,
-            BudgetCategory.MEDIUM: 0.9,
-            BudgetCategory.HIGH: 0.8
-        },
-        TopologyType.FAT_TREE: {
-            BudgetCategory.LOW: 0.1,
-            BudgetCategory.MEDIUM: 0.3,
-            BudgetCategory.HIGH: 1.0
-        }
-    }
-    
-    return match_matrix[topology][budget]
+    return float(BUDGET_MATCH[TOPOLOGY_INDEX[topology], BUDGET_INDEX[budget]])
 
 
 def _score_power_match(topology: TopologyType, power: PowerCategory) -> float:
@@ -224,26 +248,7 @@ def _score_power_match(topology: TopologyType, power: PowerCategory) -> float:
     Returns:
         Score between 0.0 and 1.0
     """
-    # Expert-defined match matrix: topology -> power -> score
-    match_matrix = {
-        TopologyType.THREE_TIER: {
-            PowerCategory.LOW: 1.0,
-            PowerCategory.MEDIUM: 0.6,
-            PowerCategory.HIGH: 0.3
-        },
-        TopologyType.LEAF_SPINE: {
-            PowerCategory.LOW: 0.5,
-            PowerCategory.MEDIUM: 0.9,
-            PowerCategory.HIGH: 0.8
-        },
-        TopologyType.FAT_TREE: {
-            PowerCategory.LOW: 0.2,
-            PowerCategory.MEDIUM: 0.4,
-            PowerCategory.HIGH: 1.0
-        }
-    }
-    
-    return match_matrix[topology][power]
+    return float(POWER_MATCH[TOPOLOGY_INDEX[topology], POWER_INDEX[power]])
 
 
 def _score_workload_match(topology: TopologyType, workload_type) -> float:
@@ -261,29 +266,7 @@ def _score_workload_match(topology: TopologyType, workload_type) -> float:
     Returns:
         Score between 0.0 and 1.0
     """
-    # Expert-defined match matrix: topology -> workload -> score
-    match_matrix = {
-        TopologyType.THREE_TIER: {
-            WorkloadType.AI_TRAINING: 0.3,
-            WorkloadType.WEB_SERVICES: 0.7,
-            WorkloadType.STORAGE: 0.8,
-            WorkloadType.MIXED: 0.5
-        },
-        TopologyType.LEAF_SPINE: {
-            WorkloadType.AI_TRAINING: 0.8,
-            WorkloadType.WEB_SERVICES: 0.9,
-            WorkloadType.STORAGE: 0.7,
-            WorkloadType.MIXED: 0.95
-        },
-        TopologyType.FAT_TREE: {
-            WorkloadType.AI_TRAINING: 1.0,
-            WorkloadType.WEB_SERVICES: 0.6,
-            WorkloadType.STORAGE: 0.5,
-            WorkloadType.MIXED: 0.7
-        }
-    }
-    
-    return match_matrix[topology][workload_type]
+    return float(WORKLOAD_MATCH[TOPOLOGY_INDEX[topology], WORKLOAD_INDEX[workload_type]])
 
 
 def _score_scalability_match(topology: TopologyType, scale: ScaleCategory) -> float:
@@ -300,26 +283,7 @@ def _score_scalability_match(topology: TopologyType, scale: ScaleCategory) -> fl
     Returns:
         Score between 0.0 and 1.0
     """
-    # Expert-defined match matrix: topology -> scale -> score
-    match_matrix = {
-        TopologyType.THREE_TIER: {
-            ScaleCategory.SMALL: 0.9,
-            ScaleCategory.MEDIUM: 0.5,
-            ScaleCategory.LARGE: 0.2
-        },
-        TopologyType.LEAF_SPINE: {
-            ScaleCategory.SMALL: 0.4,
-            ScaleCategory.MEDIUM: 0.9,
-            ScaleCategory.LARGE: 0.95
-        },
-        TopologyType.FAT_TREE: {
-            ScaleCategory.SMALL: 0.2,
-            ScaleCategory.MEDIUM: 0.5,
-            ScaleCategory.LARGE: 1.0
-        }
-    }
-    
-    return match_matrix[topology][scale]
+    return float(SCALABILITY_MATCH[TOPOLOGY_INDEX[topology], SCALE_INDEX[scale]])
 
 
 def rank_topologies(
@@ -329,6 +293,12 @@ def rank_topologies(
     """
     Calculate scores for all topologies and rank them.
     
+    The ranking depends only on the three categories, the workload type and
+    the weights, so it is memoized on those values (at most 3*3*3*4 distinct
+    category combinations per weight set). TopologyScore objects are
+    immutable; the returned list and each score's breakdown dict are fresh
+    copies per call, so callers may modify those.
+    
     Args:
         inputs: User input parameters
         classification: Classified input categories
@@ -336,14 +306,117 @@ def rank_topologies(
     Returns:
         List of TopologyScore objects, sorted by score (descending)
     """
-    from core.topology import get_all_topologies
+    ranked = _rank_cached(
+        classification.scale,
+        classification.budget,
+        classification.power,
+        inputs.workload_type,
+        tuple(SCORING_WEIGHTS[key] for _, key in _CRITERIA)
+    )
+    return [
+        TopologyScore(topology=topology, score=total, breakdown=dict(breakdown))
+        for topology, total, breakdown in ranked
+    ]
+
+
+@lru_cache(maxsize=256)
+def _rank_cached(
+    scale: ScaleCategory,
+    budget: BudgetCategory,
+    power: PowerCategory,
+    workload_type: WorkloadType,
+    weights: tuple[float, ...]
+) -> tuple:
+    """
+    Score and rank all topologies for one category combination.
     
-    scores = []
-    for topology in get_all_topologies():
-        score = calculate_topology_score(topology, inputs, classification)
-        scores.append(score)
+    All topologies are scored at once: the criterion scores form a
+    (topology x criterion) matrix, and its weighted row sums are the
+    totals. Results match calculate_topology_score.
     
-    # Sort by score (descending)
-    scores.sort(key=lambda x: x.score, reverse=True)
+    Args:
+        scale: Scale category
+        budget: Budget category
+        power: Power category
+        workload_type: Workload type
+        weights: Criterion weights in _CRITERIA order
+        
+    Returns:
+        Tuple of (topology, total score, breakdown items) in rank order
+    """
+    scale_i = SCALE_INDEX[scale]
+    
+    # Columns in _CRITERIA order; rows in TopologyType order
+    criteria = np.column_stack((
+        SCALE_MATCH[:, scale_i],
+        BUDGET_MATCH[:, BUDGET_INDEX[budget]],
+        POWER_MATCH[:, POWER_INDEX[power]],
+        WORKLOAD_MATCH[:, WORKLOAD_INDEX[workload_type]],
+        SCALABILITY_MATCH[:, scale_i]
+    ))
+    # Row sums over five columns add left to right, matching the running
+    # total in calculate_topology_score bit for bit (a BLAS dot may not)
+    totals = (criteria * weights).sum(axis=1)
+    
+    # Sort by score (descending); stable, so ties keep TopologyType order
+    order = np.argsort(-totals, kind="stable")
+    
+    topologies = tuple(TopologyType)
+    labels = [f" ({weight*100:.0f}%)" for weight in weights]
+    ranked = []
+    for i in order.tolist():
+        total = float(totals[i])
+        breakdown = tuple(
+            (name, f"{value:.2f}{label}")
+            for (name, _), value, label in zip(_CRITERIA, criteria[i].tolist(), labels)
+        ) + (("Total Score", f"{total:.2f}"),)
+        ranked.append((topologies[i], total, breakdown))
+    
+    return tuple(ranked)
+
+
+def rank_topologies_batch(
+    scale_idx: np.ndarray,
+    budget_idx: np.ndarray,
+    power_idx: np.ndarray,
+    workload_idx: np.ndarray,
+    weights: Optional[dict[str, float]] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score and rank all topologies for N input combinations at once.
     
-    return scores
+    Intended for sensitivity analysis: categories are passed as integer
+    ordinals (see SCALE_INDEX, BUDGET_INDEX, POWER_INDEX, WORKLOAD_INDEX),
+    and every combination is scored with one set of array operations
+    instead of a Python loop over rank_topologies.
+    
+    Args:
+        scale_idx: Scale category ordinals, shape (N,)
+        budget_idx: Budget category ordinals, shape (N,)
+        power_idx: Power category ordinals, shape (N,)
+        workload_idx: Workload type ordinals, shape (N,)
+        weights: Criterion weights (defaults to SCORING_WEIGHTS)
+        
+    Returns:
+        Tuple of (totals, ranking):
+        - totals: (N, 3) weighted scores, columns in TopologyType order
+        - ranking: (N, 3) topology ordinals sorted by score (descending)
+    """
+    if weights is None:
+        weights = SCORING_WEIGHTS
+    scale_idx = np.asarray(scale_idx)
+    
+    # (N, topology, criterion) scores, criteria in _CRITERIA order
+    criteria = np.stack((
+        SCALE_MATCH[:, scale_idx].T,
+        BUDGET_MATCH[:, np.asarray(budget_idx)].T,
+        POWER_MATCH[:, np.asarray(power_idx)].T,
+        WORKLOAD_MATCH[:, np.asarray(workload_idx)].T,
+        SCALABILITY_MATCH[:, scale_idx].T
+    ), axis=-1)
+    totals = (criteria * [weights[key] for _, key in _CRITERIA]).sum(axis=-1)
+    
+    # Stable, so ties keep TopologyType order as in rank_topologies
+    ranking = np.argsort(-totals, axis=1, kind="stable")
+    
+    return totals, ranking
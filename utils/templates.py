@@ -0,0 +1,181 @@
+"""
+HTML templates for the Streamlit UI.
+
+This module holds the static markup and str.format templates used by app.py.
+Streamlit re-executes app.py on every rerun, but imported modules are loaded
+once per process, so the composed strings below are built a single time.
+"""
+
+from typing import Final
+
+
+# HTML templates for the repeated result cards. Each section is rendered
+# into one string and emitted with a single st.markdown call.
+CLASS_CARD_TMPL: Final[str] = """<div style='flex: 1; background: linear-gradient(135deg, {bg_from} 0%, {bg_to} 100%); padding: 20px; border-radius: 8px; border-left: 5px solid {accent}; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+<h4 style='margin: 0 0 10px 0; color: {accent}; font-size: 16px;'>{title}</h4>
+<p style='font-size: 24px; font-weight: 700; margin: 15px 0; color: {value_color};'>{value}</p>
+<p style='font-size: 13px; color: #666; margin: 0; line-height: 1.5;'><strong>{basis_label}</strong><br>{basis}</p>
+</div>"""
+
+CONDITION_TMPL: Final[str] = """<div style='background-color: #ffffff; padding: 10px 15px; border-radius: 5px; margin-bottom: 8px; border-left: 3px solid #28a745;'>
+<p style='color: #212529; margin: 0; font-size: 14px;'>✓ <strong style='color: #212529;'>{condition}</strong></p>
+</div>"""
+
+WHYNOT_TMPL: Final[str] = """<div style='background-color: #ffffff; padding: 15px; border-radius: 6px; margin-bottom: 15px; border: 1px solid #dee2e6;'>
+<p style='color: #212529; margin: 0 0 8px 0; font-weight: 600; font-size: 15px;'><strong style='color: #2E86AB;'>{name}:</strong></p>
+<p style='color: #495057; margin: 0; font-size: 14px; line-height: 1.6;'>{reason}</p>
+</div>"""
+
+SECTION_CARD_TMPL: Final[str] = """<div style='background-color: #ffffff; padding: 20px; border-radius: 8px; border: 1px solid #dee2e6; box-shadow: 0 2px 4px rgba(0,0,0,0.05); margin-bottom: 20px;'>
+<h2 style='margin-top: 0; padding-left: 0; border-left: none; color: #2E86AB;'>{title}</h2>
+{body}
+</div>"""
+
+RECOMMENDED_CARD_TMPL: Final[str] = """<div style='background-color: #ffffff; padding: 20px; border-radius: 4px; border: 1px solid #28a745; margin-bottom: 20px;'>
+<h3 style='color: #28a745; margin-top: 0; font-size: 1.3rem; font-weight: 600;'>✅ Recommended: {topology}</h3>
+<p style='font-size: 15px; color: #495057; margin-bottom: 0;'><strong>Confidence:</strong> <span style='color: #28a745; font-weight: 600;'>{confidence:.0%}</span></p>
+</div>"""
+
+RULE_APPLIED_TMPL: Final[str] = """<div style='background-color: #e7f3ff; padding: 15px; border-radius: 6px; margin-bottom: 15px;'>
+<p style='color: #212529; margin: 0; font-size: 15px;'><strong style='color: #2E86AB;'>Rule Applied:</strong> <span style='color: #212529; font-weight: 600;'>Rule #{rule}</span></p>
+</div>"""
+
+SUMMARY_TMPL: Final[str] = """<div style='background-color: #ffffff; padding: 20px; border-radius: 6px; border: 1px solid #dee2e6;'>
+<p style='color: #212529; margin: 0; font-size: 15px; line-height: 1.7;'>{explanation}</p>
+</div>"""
+
+
+# Static page and section headers (no dynamic content)
+HEADER_HTML: Final[str] = """
+<div style='padding: 20px 0; margin-bottom: 30px; border-bottom: 2px solid #e9ecef;'>
+    <h1 style='color: #1a1a1a; margin: 0; padding: 0; border: none; font-size: 2rem; font-weight: 600;'>
+        🌐 Adaptive Topology Selection in Data Center Networks
+    </h1>
+    <p style='color: #6c757d; margin-top: 8px; font-size: 1rem; margin-bottom: 0;'>
+        Academic Decision-Support System for Network Topology Planning
+    </p>
+</div>
+"""
+
+INPUT_SECTION_HTML: Final[str] = """
+<div style='margin-bottom: 25px;'>
+    <h2 style='margin-top: 0; padding-left: 8px; border-left: 3px solid #2E86AB; color: #2E86AB; font-size: 1.5rem;'>
+        📊 Input Parameters
+    </h2>
+</div>
+"""
+
+RECOMMENDATION_SECTION_HTML: Final[str] = """
+<div style='margin-bottom: 25px;'>
+    <h2 style='margin-top: 0; padding-left: 8px; border-left: 3px solid #2E86AB; color: #2E86AB; font-size: 1.5rem;'>
+        🎯 Topology Recommendation
+    </h2>
+</div>
+"""
+
+EXPLAIN_SECTION_HTML: Final[str] = SECTION_CARD_TMPL.format(
+    title="🔍 Explain Decision",
+    body=(
+        "<p style='color: #6c757d; margin-bottom: 0;'>"
+        "Detailed explanation of the decision-making process for academic evaluation"
+        "</p>"
+    )
+)
+
+
+INFO_CARD_TMPL: Final[str] = """<div style='background-color: #ffffff; padding: 20px; border-radius: 8px; border: 1px solid #dee2e6; box-shadow: 0 2px 4px rgba(0,0,0,0.05);'>
+<h4 style='color: #2E86AB; margin-top: 0;'>{title}</h4>
+<p style='color: #6c757d; font-size: 14px; margin-bottom: 0;'>{text}</p>
+</div>"""
+
+# "What This Tool Does" cards, laid out as one CSS grid instead of st.columns
+INFO_CARDS_HTML: Final[str] = (
+    "<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px;'>"
+    + "".join(
+        INFO_CARD_TMPL.format(title=title, text=text)
+        for title, text in (
+            ("🎯 Smart Recommendations",
+             "Get topology recommendations based on rule-based logic and weighted scoring analysis."),
+            ("📊 Detailed Analysis",
+             "View comprehensive score breakdowns, comparisons, and visualizations for all topologies."),
+            ("🔍 Explainable Decisions",
+             "Understand why each topology was recommended with detailed explanations and rule breakdowns."),
+        )
+    )
+    + "</div>"
+)
+
+# Static labels and headers inside the input form and result sections
+INPUT_INTRO_HTML: Final[str] = """
+<p style='color: #495057; font-size: 14px; margin-bottom: 20px;'>
+    Please provide the following information about your data center deployment:
+</p>
+<br>
+"""
+
+SCALE_LABEL_HTML: Final[str] = """
+<p style='color: #495057; font-weight: 600; font-size: 14px; margin-bottom: 12px;'>
+    Infrastructure Scale
+</p>
+"""
+
+CONSTRAINTS_LABEL_HTML: Final[str] = """
+<p style='color: #495057; font-weight: 600; font-size: 14px; margin-bottom: 12px;'>
+    Resource Constraints
+</p>
+"""
+
+WORKLOAD_LABEL_HTML: Final[str] = """
+<br>
+<p style='color: #495057; font-weight: 600; font-size: 14px; margin-bottom: 12px;'>
+    Workload Configuration
+</p>
+"""
+
+RULE_PROCESS_HTML: Final[str] = """
+<div style='background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #2E86AB;'>
+    <h3 style='color: #2E86AB; margin-top: 0; font-weight: 600;'>Rule-Based Decision Process</h3>
+</div>
+"""
+
+CONDITIONS_LABEL_HTML: Final[str] = """
+<p style='color: #212529; font-weight: 600; font-size: 15px; margin-bottom: 10px;'>
+    Conditions that triggered this rule:
+</p>
+"""
+
+WHY_NOT_HEADER_HTML: Final[str] = """
+<div style='background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #F77F00;'>
+    <h3 style='color: #F77F00; margin-top: 0; font-weight: 600;'>Why Other Topologies Were Not Selected</h3>
+</div>
+"""
+
+SUMMARY_HEADER_HTML: Final[str] = """
+<div style='background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #28a745;'>
+    <h3 style='color: #28a745; margin-top: 0; font-weight: 600;'>Plain-English Summary</h3>
+</div>
+"""
+
+FOOTER_HTML: Final[str] = """
+<div style='text-align: center; color: #6c757d; padding: 20px;'>
+    <p><em>Academic Decision-Support System for Data Center Network Planning</em></p>
+    <p style='font-size: 0.9em;'>This tool uses rule-based logic and weighted scoring for topology recommendation.</p>
+</div>
+"""
+
+GET_STARTED_HTML: Final[str] = """
+<div style='background: linear-gradient(135deg, #e7f3ff 0%, #d0e7ff 100%); 
+            padding: 30px; 
+            border-radius: 10px; 
+            border-left: 5px solid #2E86AB;
+            margin: 40px 0;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
+    <h3 style='color: #2E86AB; margin-top: 0;'>
+        👆 Get Started
+    </h3>
+    <p style='font-size: 16px; color: #495057; line-height: 1.6; margin-bottom: 0;'>
+        Enter the required parameters above and click <strong>'Analyze & Recommend Topology'</strong> to get 
+        personalized topology suggestions based on your data center requirements.
+    </p>
+</div>
+"""
@@ -4,6 +4,7 @@ Input validation utilities.
 This module provides functions to validate user inputs before processing.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -20,15 +21,20 @@ def validate_racks(racks: int) -> tuple[bool, Optional[str]]:
     if racks is None:
         return False, "Number of racks is required"
     
-    try:
-        racks_int = int(racks)
-        if racks_int <= 0:
-            return False, "Number of racks must be positive"
-        if racks_int > 10000:
-            return False, "Number of racks seems unreasonably high (> 10,000)"
-        return True, None
-    except (ValueError, TypeError):
-        return False, "Number of racks must be a valid integer"
+    # Widget values are already numeric; only convert other types
+    if isinstance(racks, int):
+        racks_int = racks
+    else:
+        try:
+            racks_int = int(racks)
+        except (ValueError, TypeError):
+            return False, "Number of racks must be a valid integer"
+    
+    if racks_int <= 0:
+        return False, "Number of racks must be positive"
+    if racks_int > 10000:
+        return False, "Number of racks seems unreasonably high (> 10,000)"
+    return True, None
 
 
 def validate_servers(servers: int) -> tuple[bool, Optional[str]]:
@@ -44,15 +50,19 @@ def validate_servers(servers: int) -> tuple[bool, Optional[str]]:
     if servers is None:
         return False, "Number of servers is required"
     
-    try:
-        servers_int = int(servers)
-        if servers_int <= 0:
-            return False, "Number of servers must be positive"
-        if servers_int > 1000000:
-            return False, "Number of servers seems unreasonably high (> 1,000,000)"
-        return True, None
-    except (ValueError, TypeError):
-        return False, "Number of servers must be a valid integer"
+    if isinstance(servers, int):
+        servers_int = servers
+    else:
+        try:
+            servers_int = int(servers)
+        except (ValueError, TypeError):
+            return False, "Number of servers must be a valid integer"
+    
+    if servers_int <= 0:
+        return False, "Number of servers must be positive"
+    if servers_int > 1000000:
+        return False, "Number of servers seems unreasonably high (> 1,000,000)"
+    return True, None
 
 
 def validate_budget(budget: float) -> tuple[bool, Optional[str]]:
@@ -68,15 +78,19 @@ def validate_budget(budget: float) -> tuple[bool, Optional[str]]:
     if budget is None:
         return False, "Budget is required"
     
-    try:
-        budget_float = float(budget)
-        if budget_float < 0:
-            return False, "Budget cannot be negative"
-        if budget_float > 1000000000:  # 1 billion USD
-            return False, "Budget seems unreasonably high (> $1B)"
-        return True, None
-    except (ValueError, TypeError):
-        return False, "Budget must be a valid number"
+    if isinstance(budget, float):
+        budget_float = budget
+    else:
+        try:
+            budget_float = float(budget)
+        except (ValueError, TypeError):
+            return False, "Budget must be a valid number"
+    
+    if budget_float < 0:
+        return False, "Budget cannot be negative"
+    if budget_float > 1000000000:  # 1 billion USD
+        return False, "Budget seems unreasonably high (> $1B)"
+    return True, None
 
 
 def validate_power(power: float) -> tuple[bool, Optional[str]]:
@@ -92,15 +106,19 @@ def validate_power(power: float) -> tuple[bool, Optional[str]]:
     if power is None:
         return False, "Power limit is required"
     
-    try:
-        power_float = float(power)
-        if power_float <= 0:
-            return False, "Power limit must be positive"
-        if power_float > 100000:  # 100 MW
-            return False, "Power limit seems unreasonably high (> 100 MW)"
-        return True, None
-    except (ValueError, TypeError):
-        return False, "Power limit must be a valid number"
+    if isinstance(power, float):
+        power_float = power
+    else:
+        try:
+            power_float = float(power)
+        except (ValueError, TypeError):
+            return False, "Power limit must be a valid number"
+    
+    if power_float <= 0:
+        return False, "Power limit must be positive"
+    if power_float > 100000:  # 100 MW
+        return False, "Power limit seems unreasonably high (> 100 MW)"
+    return True, None
 
 
 def validate_all_inputs(racks: int, servers: int, budget: float, power: float) -> tuple[bool, Optional[str]]:
@@ -116,15 +134,34 @@ def validate_all_inputs(racks: int, servers: int, budget: float, power: float) -
     Returns:
         Tuple of (is_valid, error_message)
     """
-    validations = [
-        validate_racks(racks),
-        validate_servers(servers),
-        validate_budget(budget),
-        validate_power(power)
-    ]
+    # Widget reruns repeat the same values; unhashable inputs skip the cache
+    try:
+        return _validate_all_inputs_cached(racks, servers, budget, power)
+    except TypeError:
+        return _validate_all_inputs(racks, servers, budget, power)
+
+
+def _validate_all_inputs(racks: int, servers: int, budget: float, power: float) -> tuple[bool, Optional[str]]:
+    """Run the four validators in order (uncached body of validate_all_inputs)."""
+    # Stop at the first failure; later fields are not checked
+    is_valid, error_msg = validate_racks(racks)
+    if not is_valid:
+        return False, error_msg
     
-    for is_valid, error_msg in validations:
-        if not is_valid:
-            return False, error_msg
+    is_valid, error_msg = validate_servers(servers)
+    if not is_valid:
+        return False, error_msg
+    
+    is_valid, error_msg = validate_budget(budget)
+    if not is_valid:
+        return False, error_msg
+    
+    is_valid, error_msg = validate_power(power)
+    if not is_valid:
+        return False, error_msg
     
     return True, None
+
+
+# typed=True keeps e.g. 5 and 5.0 in separate entries
+_validate_all_inputs_cached = lru_cache(maxsize=256, typed=True)(_validate_all_inputs)
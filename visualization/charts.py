@@ -5,37 +5,54 @@ This module provides functions to create comparison charts and tables
 for topology analysis.
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+# pandas and matplotlib are imported inside the functions that need them,
+# so importing this module stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
 
 from core.models import TopologyScore, TopologyType
 from core.topology import get_topology_comparison, get_topology_characteristics
 
 
-def create_comparison_dataframe() -> pd.DataFrame:
+# Bar colors by topology; unlisted topologies fall back to grey
+_SCORE_COLORS = {
+    TopologyType.THREE_TIER: "#E63946",      # Red
+    TopologyType.LEAF_SPINE: "#F77F00",      # Orange
+    TopologyType.FAT_TREE: "#FCBF49"         # Yellow
+}
+
+
+def create_comparison_dataframe() -> "pd.DataFrame":
     """
     Create a pandas DataFrame comparing all topologies.
     
     Returns:
-        DataFrame with topology comparison data
+        DataFrame with topology comparison data (a fresh copy per call)
     """
+    return _comparison_dataframe().copy()
+
+
+@lru_cache(maxsize=1)
+def _comparison_dataframe() -> "pd.DataFrame":
+    """Build the comparison frame once; the underlying data never changes."""
+    import pandas as pd
+    
     comparison = get_topology_comparison()
     
-    data = []
-    for topology_name, props in comparison.items():
-        data.append({
-            "Topology": topology_name,
-            "Cost": props["Cost"],
-            "Scalability": props["Scalability"],
-            "Complexity": props["Complexity"],
-            "Description": props["Description"]
-        })
-    
-    return pd.DataFrame(data)
+    # Build column-wise from the comparison mapping (no per-row dicts)
+    df = pd.DataFrame.from_dict(
+        comparison,
+        orient="index",
+        columns=["Cost", "Scalability", "Complexity", "Description"]
+    )
+    return df.rename_axis("Topology").reset_index()
 
 
-def create_score_comparison_chart(scores: list[TopologyScore]) -> plt.Figure:
+def create_score_comparison_chart(scores: list[TopologyScore]) -> "Figure":
     """
     Create a bar chart comparing topology scores.
     
@@ -45,38 +62,26 @@ def create_score_comparison_chart(scores: list[TopologyScore]) -> plt.Figure:
     Returns:
         Matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 6), facecolor='white')
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 6), facecolor='white')
+    ax = fig.subplots()
     
     topologies = [score.topology.value for score in scores]
     score_values = [score.score for score in scores]
     
-    # Color mapping
-    colors = {
-        "Three-Tier": "#E63946",      # Red
-        "Leaf-Spine": "#F77F00",      # Orange
-        "Fat-Tree": "#FCBF49"         # Yellow
-    }
-    
     bars = ax.bar(
         topologies,
         score_values,
-        color=[colors.get(t, "#6C757D") for t in topologies],
+        color=[_SCORE_COLORS.get(score.topology, "#6C757D") for score in scores],
         alpha=0.8,
         edgecolor="black",
         linewidth=1.5
     )
     
     # Add value labels on bars
-    for bar, score in zip(bars, score_values):
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width() / 2.,
-            height + 0.01,
-            f'{score:.2f}',
-            ha='center',
-            va='bottom',
-            fontweight='bold'
-        )
+    ax.bar_label(bars, labels=[f'{score:.2f}' for score in score_values],
+                 padding=3, fontweight='bold')
     
     ax.set_ylabel('Weighted Score', fontsize=12, fontweight='bold')
     ax.set_xlabel('Topology', fontsize=12, fontweight='bold')
@@ -85,13 +90,13 @@ def create_score_comparison_chart(scores: list[TopologyScore]) -> plt.Figure:
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
     
-    plt.xticks(rotation=0)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=0)
+    fig.tight_layout()
     
     return fig
 
 
-def create_score_breakdown_chart(score: TopologyScore) -> plt.Figure:
+def create_score_breakdown_chart(score: TopologyScore) -> "Figure":
     """
     Create a horizontal bar chart showing score breakdown.
     
@@ -101,14 +106,19 @@ def create_score_breakdown_chart(score: TopologyScore) -> plt.Figure:
     Returns:
         Matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 6), facecolor='white')
+    from matplotlib.figure import Figure
     
-    # Extract breakdown data (excluding Total Score)
-    breakdown = {k: float(v.split()[0]) for k, v in score.breakdown.items() 
-                 if k != "Total Score"}
+    fig = Figure(figsize=(10, 6), facecolor='white')
+    ax = fig.subplots()
     
-    categories = list(breakdown.keys())
-    values = list(breakdown.values())
+    # Extract breakdown data (excluding Total Score); each entry reads
+    # like "0.90 (25%)", so the value is the text before the first space
+    categories = []
+    values = []
+    for criterion, text in score.breakdown.items():
+        if criterion != "Total Score":
+            categories.append(criterion)
+            values.append(float(text.partition(" ")[0]))
     
     # Create horizontal bar chart
     bars = ax.barh(
@@ -121,16 +131,8 @@ def create_score_breakdown_chart(score: TopologyScore) -> plt.Figure:
     )
     
     # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, values)):
-        width = bar.get_width()
-        ax.text(
-            width + 0.01,
-            bar.get_y() + bar.get_height() / 2.,
-            f'{val:.2f}',
-            ha='left',
-            va='center',
-            fontweight='bold'
-        )
+    ax.bar_label(bars, labels=[f'{val:.2f}' for val in values],
+                 padding=3, fontweight='bold')
     
     ax.set_xlabel('Score', fontsize=12, fontweight='bold')
     ax.set_title(f'{score.topology.value} - Score Breakdown', 
@@ -139,6 +141,6 @@ def create_score_breakdown_chart(score: TopologyScore) -> plt.Figure:
     ax.grid(axis='x', alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     return fig
@@ -4,15 +4,23 @@ Network topology graph visualization using NetworkX.
 This module generates abstract network topology diagrams for each topology type.
 """
 
+from functools import lru_cache
+from itertools import product
+
 import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
 from matplotlib.patches import FancyBboxPatch
-from typing import Optional
+from typing import Iterator, Optional
 import io
 
 from core.models import TopologyType
 
+# Diagrams show at most this many racks; larger inputs draw the same graph
+MAX_DIAGRAM_RACKS = 12
+
 
+@lru_cache(maxsize=16)
 def create_three_tier_graph(num_racks: int = 12) -> nx.DiGraph:
     """
     Create a NetworkX graph representing a Three-Tier topology.
@@ -26,51 +34,43 @@ def create_three_tier_graph(num_racks: int = 12) -> nx.DiGraph:
         num_racks: Number of racks (determines access switches)
         
     Returns:
-        NetworkX DiGraph representing the topology
+        Frozen NetworkX DiGraph representing the topology, shared between
+        calls with the same num_racks (use G.copy() for a mutable graph)
     """
     G = nx.DiGraph()
     
     # Limit racks for visualization clarity
-    num_racks = min(num_racks, 12)
+    num_racks = min(num_racks, MAX_DIAGRAM_RACKS)
     
     # Core layer (2 switches)
     core_switches = [f"Core-{i+1}" for i in range(2)]
-    for switch in core_switches:
-        G.add_node(switch, layer="core", node_type="switch")
+    G.add_nodes_from(core_switches, layer="core", node_type="switch")
     
     # Aggregation layer (2-4 switches based on scale)
     num_agg = min(4, max(2, (num_racks + 1) // 3))
     agg_switches = [f"Agg-{i+1}" for i in range(num_agg)]
-    for switch in agg_switches:
-        G.add_node(switch, layer="aggregation", node_type="switch")
+    G.add_nodes_from(agg_switches, layer="aggregation", node_type="switch")
     
     # Access layer (one per rack)
     access_switches = [f"Access-{i+1}" for i in range(num_racks)]
-    for switch in access_switches:
-        G.add_node(switch, layer="access", node_type="switch")
+    G.add_nodes_from(access_switches, layer="access", node_type="switch")
     
     # Connect core to aggregation (full mesh)
-    for core in core_switches:
-        for agg in agg_switches:
-            G.add_edge(core, agg)
+    G.add_edges_from(product(core_switches, agg_switches))
     
     # Connect aggregation to access (distributed)
-    for i, access in enumerate(access_switches):
-        agg_idx = i % num_agg
-        G.add_edge(agg_switches[agg_idx], access)
+    G.add_edges_from(
+        (agg_switches[i % num_agg], access)
+        for i, access in enumerate(access_switches)
+    )
     
     # Add sample servers (2 per rack for visualization)
-    server_count = 0
-    for access in access_switches:
-        for j in range(2):  # 2 servers per rack shown
-            server_id = f"S{server_count+1}"
-            G.add_node(server_id, layer="server", node_type="server")
-            G.add_edge(access, server_id)
-            server_count += 1
-    
-    return G
+    _add_servers(G, access_switches)
+    
+    return nx.freeze(G)
 
 
+@lru_cache(maxsize=16)
 def create_leaf_spine_graph(num_racks: int = 12) -> nx.DiGraph:
     """
     Create a NetworkX graph representing a Leaf-Spine topology.
@@ -90,41 +90,33 @@ def create_leaf_spine_graph(num_racks: int = 12) -> nx.DiGraph:
         num_racks: Number of racks (determines leaf switches)
         
     Returns:
-        NetworkX DiGraph representing the topology
+        Frozen NetworkX DiGraph representing the topology, shared between
+        calls with the same num_racks (use G.copy() for a mutable graph)
     """
     G = nx.DiGraph()
     
     # Limit racks for visualization clarity
-    num_racks = min(num_racks, 12)
+    num_racks = min(num_racks, MAX_DIAGRAM_RACKS)
     
     # Spine layer (2-4 switches)
     num_spine = min(4, max(2, (num_racks + 1) // 3))
     spine_switches = [f"Spine-{i+1}" for i in range(num_spine)]
-    for switch in spine_switches:
-        G.add_node(switch, layer="spine", node_type="switch")
+    G.add_nodes_from(spine_switches, layer="spine", node_type="switch")
     
     # Leaf layer (one per rack)
     leaf_switches = [f"Leaf-{i+1}" for i in range(num_racks)]
-    for switch in leaf_switches:
-        G.add_node(switch, layer="leaf", node_type="switch")
+    G.add_nodes_from(leaf_switches, layer="leaf", node_type="switch")
     
     # Connect spine to leaf (full mesh)
-    for spine in spine_switches:
-        for leaf in leaf_switches:
-            G.add_edge(spine, leaf)
+    G.add_edges_from(product(spine_switches, leaf_switches))
     
     # Add sample servers (2 per rack for visualization)
-    server_count = 0
-    for leaf in leaf_switches:
-        for j in range(2):  # 2 servers per rack shown
-            server_id = f"S{server_count+1}"
-            G.add_node(server_id, layer="server", node_type="server")
-            G.add_edge(leaf, server_id)
-            server_count += 1
-    
-    return G
+    _add_servers(G, leaf_switches)
+    
+    return nx.freeze(G)
 
 
+@lru_cache(maxsize=16)
 def create_fat_tree_graph(num_racks: int = 12) -> nx.DiGraph:
     """
     Create a NetworkX graph representing a Fat-Tree topology.
@@ -146,56 +138,92 @@ def create_fat_tree_graph(num_racks: int = 12) -> nx.DiGraph:
         num_racks: Number of racks (determines edge switches)
         
     Returns:
-        NetworkX DiGraph representing the topology
+        Frozen NetworkX DiGraph representing the topology, shared between
+        calls with the same num_racks (use G.copy() for a mutable graph)
     """
     G = nx.DiGraph()
     
     # Limit racks for visualization clarity
-    num_racks = min(num_racks, 12)
+    num_racks = min(num_racks, MAX_DIAGRAM_RACKS)
     
     # Core layer (4-8 switches)
     num_core = min(8, max(4, num_racks // 2))
     core_switches = [f"Core-{i+1}" for i in range(num_core)]
-    for switch in core_switches:
-        G.add_node(switch, layer="core", node_type="switch")
+    G.add_nodes_from(core_switches, layer="core", node_type="switch")
     
     # Aggregation layer (4-8 switches)
     num_agg = min(8, max(4, num_racks // 2))
     agg_switches = [f"Agg-{i+1}" for i in range(num_agg)]
-    for switch in agg_switches:
-        G.add_node(switch, layer="aggregation", node_type="switch")
+    G.add_nodes_from(agg_switches, layer="aggregation", node_type="switch")
     
     # Edge layer (one per rack)
     edge_switches = [f"Edge-{i+1}" for i in range(num_racks)]
-    for switch in edge_switches:
-        G.add_node(switch, layer="edge", node_type="switch")
-    
-    # Connect core to aggregation (distributed)
-    for i, agg in enumerate(agg_switches):
-        core_idx = i % num_core
-        G.add_edge(core_switches[core_idx], agg)
-        # Also connect to adjacent cores for redundancy
-        if core_idx + 1 < num_core:
-            G.add_edge(core_switches[core_idx + 1], agg)
-    
-    # Connect aggregation to edge (distributed)
-    for i, edge in enumerate(edge_switches):
-        agg_idx = i % num_agg
-        G.add_edge(agg_switches[agg_idx], edge)
-        # Also connect to adjacent aggregators for redundancy
-        if agg_idx + 1 < num_agg:
-            G.add_edge(agg_switches[agg_idx + 1], edge)
+    G.add_nodes_from(edge_switches, layer="edge", node_type="switch")
+    
+    # Connect core to aggregation (distributed), plus the adjacent core
+    # for redundancy
+    G.add_edges_from(_redundant_links(core_switches, agg_switches))
+    
+    # Connect aggregation to edge (distributed), plus the adjacent
+    # aggregator for redundancy
+    G.add_edges_from(_redundant_links(agg_switches, edge_switches))
     
     # Add sample servers (2 per rack for visualization)
-    server_count = 0
-    for edge in edge_switches:
-        for j in range(2):  # 2 servers per rack shown
-            server_id = f"S{server_count+1}"
-            G.add_node(server_id, layer="server", node_type="server")
-            G.add_edge(edge, server_id)
-            server_count += 1
-    
-    return G
+    _add_servers(G, edge_switches)
+    
+    return nx.freeze(G)
+
+
+def _redundant_links(upper: list[str], lower: list[str]) -> Iterator[tuple[str, str]]:
+    """
+    Yield fat-tree links from the upper to the lower layer.
+    
+    Each lower switch connects to upper[i % len(upper)] and, when it
+    exists, the next upper switch for redundancy.
+    """
+    num_upper = len(upper)
+    for i, switch in enumerate(lower):
+        upper_idx = i % num_upper
+        yield upper[upper_idx], switch
+        if upper_idx + 1 < num_upper:
+            yield upper[upper_idx + 1], switch
+
+
+def _add_servers(G: nx.DiGraph, rack_switches: list[str]) -> None:
+    """Attach 2 sample servers (S1, S2, ...) below each rack switch."""
+    servers = [f"S{i+1}" for i in range(2 * len(rack_switches))]
+    G.add_nodes_from(servers, layer="server", node_type="server")
+    G.add_edges_from(zip(
+        (switch for switch in rack_switches for _ in range(2)),
+        servers
+    ))
+
+
+_GRAPH_CREATORS = {
+    TopologyType.THREE_TIER: create_three_tier_graph,
+    TopologyType.LEAF_SPINE: create_leaf_spine_graph,
+    TopologyType.FAT_TREE: create_fat_tree_graph
+}
+
+# Layer order (top to bottom) used to lay out each topology
+_LAYOUT_LAYERS = {
+    TopologyType.THREE_TIER: ("core", "aggregation", "access", "server"),
+    TopologyType.LEAF_SPINE: ("spine", "leaf", "server"),
+    TopologyType.FAT_TREE: ("core", "aggregation", "edge", "server")
+}
+
+# Diagram titles with a short structural description
+_TITLES = {
+    TopologyType.THREE_TIER: "Three-Tier Topology\n(Core → Aggregation → Access hierarchical structure)",
+    TopologyType.LEAF_SPINE: "Leaf-Spine Topology\n(Equal-cost multipath, two-tier flat structure)",
+    TopologyType.FAT_TREE: "Fat-Tree Topology\n(Clos-style k-ary structure with increasing bandwidth toward core)"
+}
+
+# Node fill colors by node_type
+_NODE_COLORS = {
+    "switch": "#2E86AB",  # Blue
+    "server": "#A23B72"   # Purple
+}
 
 
 def draw_topology_graph(
@@ -203,7 +231,7 @@ def draw_topology_graph(
     num_racks: int = 12,
     figsize: tuple = (12, 8),
     dpi: int = 100
-) -> plt.Figure:
+) -> Figure:
     """
     Draw a topology graph using NetworkX and Matplotlib.
     
@@ -216,31 +244,13 @@ def draw_topology_graph(
     Returns:
         Matplotlib Figure object
     """
-    # Create graph based on topology type
-    graph_creators = {
-        TopologyType.THREE_TIER: create_three_tier_graph,
-        TopologyType.LEAF_SPINE: create_leaf_spine_graph,
-        TopologyType.FAT_TREE: create_fat_tree_graph
-    }
-    
-    G = graph_creators[topology](num_racks)
-    
-    # Create figure
-    fig, ax = plt.subplots(figsize=figsize, dpi=dpi, facecolor='white')
-    
-    # Define layout based on topology
-    if topology == TopologyType.THREE_TIER:
-        pos = _hierarchical_layout(G, layers=["core", "aggregation", "access", "server"])
-    elif topology == TopologyType.LEAF_SPINE:
-        pos = _hierarchical_layout(G, layers=["spine", "leaf", "server"])
-    else:  # FAT_TREE
-        pos = _hierarchical_layout(G, layers=["core", "aggregation", "edge", "server"])
-    
-    # Color mapping
-    color_map = {
-        "switch": "#2E86AB",  # Blue
-        "server": "#A23B72"   # Purple
-    }
+    # Graph and layout are memoized per (topology, num_racks)
+    G = _GRAPH_CREATORS[topology](num_racks)
+    pos = _topology_layout(topology, num_racks)
+    
+    # Create figure (not registered with pyplot, so nothing to close)
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.subplots()
     
     # Draw nodes by type
     for node_type in ["switch", "server"]:
@@ -249,7 +259,7 @@ def draw_topology_graph(
             nx.draw_networkx_nodes(
                 G, pos,
                 nodelist=nodes,
-                node_color=color_map[node_type],
+                node_color=_NODE_COLORS[node_type],
                 node_size=800 if node_type == "switch" else 300,
                 node_shape="s" if node_type == "switch" else "o",
                 ax=ax,
@@ -280,13 +290,7 @@ def draw_topology_graph(
     )
     
     # Add title with structural description
-    title_map = {
-        TopologyType.THREE_TIER: "Three-Tier Topology\n(Core → Aggregation → Access hierarchical structure)",
-        TopologyType.LEAF_SPINE: "Leaf-Spine Topology\n(Equal-cost multipath, two-tier flat structure)",
-        TopologyType.FAT_TREE: "Fat-Tree Topology\n(Clos-style k-ary structure with increasing bandwidth toward core)"
-    }
-    
-    ax.set_title(title_map[topology], fontsize=14, fontweight="bold", pad=20)
+    ax.set_title(_TITLES[topology], fontsize=14, fontweight="bold", pad=20)
     ax.axis("off")
     
     # Add caption explaining abstraction
@@ -298,19 +302,26 @@ def draw_topology_graph(
     fig.text(0.5, 0.02, caption_text, ha='center', fontsize=9, 
              style='italic', color='#666666', wrap=True)
     
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.08)  # Make room for caption
+    fig.tight_layout()
+    fig.subplots_adjust(bottom=0.08)  # Make room for caption
     
     return fig
 
 
-def _hierarchical_layout(G: nx.DiGraph, layers: list[str]) -> dict:
+@lru_cache(maxsize=32)
+def _topology_layout(topology: TopologyType, num_racks: int) -> dict:
+    """Memoized node positions for one topology graph (read-only)."""
+    G = _GRAPH_CREATORS[topology](num_racks)
+    return _hierarchical_layout(G, layers=_LAYOUT_LAYERS[topology])
+
+
+def _hierarchical_layout(G: nx.DiGraph, layers: tuple[str, ...]) -> dict:
     """
     Create a hierarchical layout for the graph based on layers.
     
     Args:
         G: NetworkX graph
-        layers: List of layer names in order from top to bottom
+        layers: Layer names in order from top to bottom
         
     Returns:
         Dictionary mapping nodes to (x, y) positions
@@ -337,9 +348,9 @@ def _hierarchical_layout(G: nx.DiGraph, layers: list[str]) -> dict:
         num_nodes = len(nodes)
         x_spacing = 1.0 / (num_nodes + 1) if num_nodes > 0 else 1.0
         
-        for i, node in enumerate(nodes):
-            x = (i + 1) * x_spacing
-            pos[node] = (x, y_pos)
+        # (i + 1) * x_spacing for the whole layer; same floats as the scalar form
+        xs = (np.arange(1, num_nodes + 1) * x_spacing).tolist()
+        pos.update(zip(nodes, zip(xs, [y_pos] * num_nodes)))
         
         y_pos -= y_spacing
     